@@ -0,0 +1,48 @@
+"""Module to hold the bit stream the encoded data is written to (sections 7.4.2 to 7.4.10 of ISO 18004)"""
+
+
+class QRCodeBitStream:
+    """Class to model a stream of bits, most significant bit first, as they are laid out in the codewords.
+       The bits are accumulated in a single integer: appending a value of n bits is a shift by n and an OR, with no per bit or per byte work.
+       The packed bytes and the ASCII representation ('0' and '1' characters, as returned by QRCodeEncoder) are only built on demand.
+    """
+
+    __slots__ = ("_value", "_bit_length")
+
+    def __init__(self):
+        self._value = 0
+        self._bit_length = 0
+
+    def __len__(self):
+        """Number of bits written to the stream"""
+        return self._bit_length
+
+    def extend_bits(self, value: int, bit_count: int):
+        """Appends the bit_count least significant bits of value to the stream, most significant bit first.
+
+        Args:
+            value (int): value to be appended. It must fit in bit_count bits.
+            bit_count (int): number of bits used to represent value in the stream.
+        """
+        self._value = (self._value << bit_count) | value
+        self._bit_length += bit_count
+
+    def extend_bytes(self, data: bytes):
+        """Appends whole bytes to the stream (8 bits each), all at once"""
+        self.extend_bits(int.from_bytes(data, "big"), len(data) << 3)
+
+    def extend_ascii(self, bits: bytes):
+        """Appends a bit string in its ASCII representation (e.g., b'0100', as used for the mode indicators) to the stream"""
+        if bits:
+            self.extend_bits(int(bits, 2), len(bits))
+
+    def to_bytes(self) -> bytes:
+        """Returns the packed bits. If the bit length is not a multiple of 8, the last byte is padded with zeroes to the right"""
+        padding_bits = -self._bit_length % 8
+        return (self._value << padding_bits).to_bytes((self._bit_length + padding_bits) >> 3, "big")
+
+    def to_ascii(self) -> bytes:
+        """Returns the stream as a string of ASCII '0' and '1' characters, one per bit"""
+        if not self._bit_length:
+            return b''
+        return format(self._value, f'0{self._bit_length}b').encode('ascii')
@@ -3,9 +3,46 @@
     division, data and error codewords generation and encoding (up to section 7.6 of ISO 18004)
 """
 
+from functools import lru_cache
 from src.qr.error.QRErrorCorrectionLevel import QRErrorCorrectionLevel
 from src.qr.QRCodeInputAnalyzer import QRCodeInputAnalyzer
-from src.qr.error.utils.QRCodePolynomial import PolynomialOperations, IntPolynomial, Term
+from src.qr.QRCodeBitStream import QRCodeBitStream
+from src.qr.QRCodeMode import QRCodeMode, MODE_INDICATORS, CHAR_COUNT_BITS
+from src.qr.error.utils.QRCodePolynomial import PolynomialOperations, IntPolynomial
+
+# pad codewords of section 7.4.10, added alternately after the terminator until the data capacity of the symbol is filled
+_PAD_CODEWORD_0 = b'11101100'
+_PAD_CODEWORD_1 = b'00010001'
+_PAD_CODEWORD_PAIR = _PAD_CODEWORD_0 + _PAD_CODEWORD_1
+
+@lru_cache(maxsize=None)
+def _get_pad_codewords(data_capacity_bits: int) -> bytes:
+    """Returns the pad codewords filling the whole data capacity of a symbol (in bits), built once per version and error correction level.
+       As the pad codewords always start with _PAD_CODEWORD_0, the ones required by any encoded input are a prefix of this string.
+    """
+    pad_codewords = data_capacity_bits // 8
+    return _PAD_CODEWORD_PAIR * (pad_codewords // 2) + (_PAD_CODEWORD_0 if pad_codewords % 2 else b'')
+
+# Table 5 of ISO 18004: value of each character of the alphanumeric mode. Lower case letters have the value of their upper case counterpart
+_ALPHANUMERIC_VALUES = {char: value for value, char in enumerate("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:")}
+_ALPHANUMERIC_VALUES.update({char.lower(): _ALPHANUMERIC_VALUES[char] for char in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"})
+
+# number of digits parsed at once by the numeric mode (a multiple of 3)
+_NUMERIC_CHUNK_DIGITS = 300
+
+def _build_kanji_codes():
+    """Builds the 13-bit value of every Shift JIS value accepted by the Kanji mode (section 7.4.6 of ISO 18004), keyed by the
+       Shift JIS value: the value minus 0x8140 (from 0x8140 to 0x9FFC) or 0xC140 (from 0xE040 to 0xEBBF), with its most significant byte
+       multiplied by 0xC0 and added to its least significant byte.
+    """
+    kanji_codes = {}
+    for lower_bound, upper_bound, baseline in ((0x8140, 0x9ffc, 0x8140), (0xe040, 0xebbf, 0xc140)):
+        for shift_jis_value in range(lower_bound, upper_bound + 1):
+            intermediate_sub = shift_jis_value - baseline
+            kanji_codes[shift_jis_value] = (intermediate_sub >> 8) * 0xc0 + (intermediate_sub & 0xff)
+    return kanji_codes
+
+_KANJI_CODES = _build_kanji_codes()
 
 class QRCodeEncoder:
     """
@@ -23,44 +60,37 @@ class QRCodeEncoder:
         self.analyzer = analyzer
 
     @staticmethod
-    def get_mode_indicator(mode: str) -> bin:
+    def get_mode_indicator(mode: QRCodeMode | str) -> bytes:
         """
         Get the mode indicator for a specific mode.
         
         Args:
-            mode (str): The mode of the QR code (e.g., "NUMERIC", "ALPHANUMERIC", "BYTE", "KANJI").
+            mode (QRCodeMode | str): The mode of the QR code, or its name (e.g., "NUMERIC", "ALPHANUMERIC", "BYTE", "KANJI").
         
         Returns:
-            int: The mode indicator as an integer.
+            bytes: The mode indicator as a bit string, or None for an unknown mode name.
         """
-        try:
-            mode_indicators = {
-                "NUMERIC": b'0001',
-                "ALPHANUMERIC": b'0010',
-                "BYTE": b'0100',
-                "KANJI": b'1000'
-            }
-            return mode_indicators.get(mode.upper(), None)
-        except KeyError as exc:
-            raise KeyError(f"Invalid mode: {mode}. Supported modes are: 'NUMERIC', 'ALPHANUMERIC', 'BYTE', 'KANJI'.") from exc
+        if not isinstance(mode, QRCodeMode):
+            mode = QRCodeMode.from_name(mode.upper())
+            if mode is None:
+                return None
+        return MODE_INDICATORS[mode]
     
     @staticmethod    
-    def get_char_count_indicator(mode: str) -> int:
+    def get_char_count_indicator(mode: QRCodeMode | str) -> int:
         """Get the character count indicator per mode. for QR codes of version 1 to 9 is as below as in page 23 of the ISO 18004:2015 standard.
 
         Args:
-            mode (str): encoding mode of the QR code data
+            mode (QRCodeMode | str): encoding mode of the QR code data, or its name
 
         Returns:
-            int: number of bits that the encoded data needs to have.
+            int: number of bits that the encoded data needs to have, or None for an unknown mode name.
         """
-        bit_count = {
-            "NUMERIC": 10,
-            "ALPHANUMERIC": 9,
-            "BYTE": 8,
-            "KANJI": 8
-        }
-        return bit_count.get(mode.upper(), None)
+        if not isinstance(mode, QRCodeMode):
+            mode = QRCodeMode.from_name(mode.upper())
+            if mode is None:
+                return None
+        return CHAR_COUNT_BITS[mode]
 
     def get_remainder_bits(self):
         """Method to return the remainder bits to be appended to every codeword message as per
@@ -101,20 +131,15 @@ class QRCodeEncoder:
         Returns:
             bytes: the bit stream encoded following the ISO rules.
         """
-        encoding_mode = self.analyzer.analyse(input_str).upper()
-        encoding_char_count_indicator = self.get_char_count_indicator(encoding_mode)
-        mode_indicator = self.get_mode_indicator(encoding_mode)
-        match encoding_mode:
-            case 'NUMERIC':
-                return self.encode_numeric(input_str, encoding_char_count_indicator, mode_indicator)
-            case 'ALPHANUMERIC':
-                return self.encode_alphanumeric(input_str, encoding_char_count_indicator, mode_indicator)
-            case 'BYTE':
-                return self.encode_bytes(input_str, encoding_char_count_indicator, mode_indicator)
-            case 'KANJI':
-                return self.encode_kanji(input_str.encode(encoding='shift-jis'), encoding_char_count_indicator, mode_indicator)
-            case _:
-                raise ValueError(f"Unknown format of string {input_str}. Please correct your input and try again")
+        encoding_mode = QRCodeMode.from_name(self.analyzer.analyse(input_str))
+        if encoding_mode is None:
+            raise ValueError(f"Unknown format of string {input_str}. Please correct your input and try again")
+        if encoding_mode is QRCodeMode.KANJI:
+            input_str = input_str.encode(encoding='shift-jis')
+        # the encoding methods are indexed by mode, like the mode and character count indicators. They are looked up on the instance,
+        # so subclasses overriding any of them are honoured
+        encoder = getattr(self, self._ENCODER_NAMES[encoding_mode])
+        return encoder(input_str, CHAR_COUNT_BITS[encoding_mode], MODE_INDICATORS[encoding_mode])
 
     def encode_numeric(self, input_str: str, char_count_indicator: int, mode_indicator: bytes) -> bytes:
         """
@@ -126,51 +151,40 @@ class QRCodeEncoder:
         Returns:
             bytes: Encoded numeric data as bytes.
         """
-        if mode_indicator != self.get_mode_indicator("NUMERIC"):
+        if mode_indicator != MODE_INDICATORS[QRCodeMode.NUMERIC]:
             raise ValueError("Invalid mode indicator for numeric encoding.")
-        if char_count_indicator != self.get_char_count_indicator("NUMERIC"):
+        if char_count_indicator != CHAR_COUNT_BITS[QRCodeMode.NUMERIC]:
             raise ValueError("Invalid character count indicator for numeric encoding.")
-        bytes_array = []
-        index = 0
-        while index < len(input_str):
-            curr_group = input_str[index: min(index + 3, len(input_str))]
-            curr_digit_group = bin(int(curr_group))[2:]  # Remove '0b' prefix
-            if len(curr_group) == 3:
-                padding = '0' * max(0, (char_count_indicator - len(curr_digit_group)))
-            # handle edges case where the last group has less than 3 digits
-            elif len(curr_group) == 2:
-                padding = '0' * max(0, (7 - len(curr_digit_group)))
-            else:
-                # handle edges case where the last group has less than 3 digits
-                padding = '0' * max(0, (4 - len(curr_digit_group)))
-            bytes_array.append(padding + curr_digit_group)
-            index += 3
-        bytes_array = bytes("".join(bytes_array), encoding='utf-8')
-        binary_count = bin(len(input_str))
-        padding = "0" * (char_count_indicator - len(binary_count))
-        binary_count = bytes(padding + binary_count[2:], encoding='utf-8')  # Remove '0b' prefix
-        return mode_indicator + binary_count + bytes_array
+        bit_stream = QRCodeBitStream()
+        bit_stream.extend_ascii(mode_indicator)
+        # the character count takes char_count_indicator - 2 bits (the length of its "0b" representation)
+        bit_stream.extend_bits(len(input_str), max(char_count_indicator - 2, len(input_str).bit_length()))
+        # each group of 3 digits takes 10 bits. The digits are parsed a chunk at a time and the groups are split with divmod, so the
+        # groups of a chunk are packed into a single value (chunks keep int() below the limit of digits it converts)
+        full_groups_length = len(input_str) - len(input_str) % 3
+        for start in range(0, full_groups_length, _NUMERIC_CHUNK_DIGITS):
+            end = min(start + _NUMERIC_CHUNK_DIGITS, full_groups_length)
+            chunk_value = int(input_str[start:end])
+            chunk_bit_length = (end - start) // 3 * 10
+            packed_groups = 0
+            for shift in range(0, chunk_bit_length, 10):
+                chunk_value, digit_group = divmod(chunk_value, 1000)
+                packed_groups |= digit_group << shift
+            bit_stream.extend_bits(packed_groups, chunk_bit_length)
+        # handle edges case where the last group has less than 3 digits: 2 digits take 7 bits and 1 digit takes 4 bits
+        remaining_digits = input_str[full_groups_length:]
+        if remaining_digits:
+            bit_stream.extend_bits(int(remaining_digits), 7 if len(remaining_digits) == 2 else 4)
+        return bit_stream.to_ascii()
 
     @staticmethod
-    def get_encode_decode_table_alphanumeric(character: str) -> dict:
+    def get_encode_decode_table_alphanumeric(character: str) -> int:
         """
-        Get the encoding and decoding table for alphanumeric mode.
-        Raise:
-            KeyError: if the character is out of the range of valid alphanumeric characters.
+        Get the value of a character in the alphanumeric mode (Table 5 of ISO 18004).
         Returns:
-            dict: a dictionary mapping alphanumeric characters to their corresponding values.
+            int: the value of the character, or None if it is out of the range of valid alphanumeric characters.
         """
-        try:
-            char_map =  {
-                '0': 0, '1': 1, '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9,
-                'A': 10, 'B': 11, 'C': 12, 'D': 13, 'E': 14, 'F': 15, 'G': 16, 'H': 17, 'I': 18, 'J': 19,
-                'K': 20, 'L': 21, 'M': 22, 'N': 23, 'O': 24, 'P': 25, 'Q': 26, 'R': 27, 'S': 28, 'T': 29,
-                'U': 30, 'V': 31, 'W': 32, 'X': 33, 'Y': 34, 'Z': 35, ' ': 36, '$': 37, '%': 38, '*': 39,
-                '+': 40, '-': 41, '.': 42, '/': 43, ':': 44
-            }
-            return char_map.get(character.upper(), None)
-        except KeyError as exc:
-            raise KeyError(f"Invalid character: {character}. Supported characters are alphanumeric characters and the symbols $, %, *, +, -, ., /,:, and space.") from exc   
+        return _ALPHANUMERIC_VALUES.get(character, None)
 
     def encode_alphanumeric(self, input_str: str, char_count_indicator: int, mode_indicator: bytes) -> bytes:
         """
@@ -184,23 +198,20 @@ class QRCodeEncoder:
         Returns:
             bytes: a byte string with the encoded alphanumeric data.
         """
-        encoded_data = []
-        index = 0
-        MULTIPLIER = 45  # The multiplier for alphanumeric encoding
-        while index < len(input_str):
-            group_data = input_str[index: min(index + 2, len(input_str))]
-            # Get the value of the first and second characters in the group
-            char_values = [-1,-1]
-            char_values[0] = self.get_encode_decode_table_alphanumeric(group_data[0])
-            if len(group_data) == 2:
-                char_values[1] = self.get_encode_decode_table_alphanumeric(group_data[1]) if len(group_data) > 1 else 0
-            if char_values[1] != -1:
-                encoded_group = (char_values[0] * MULTIPLIER + char_values[1])
-                encoded_data.append(bin(encoded_group)[2:].zfill(11))
-            else:
-                encoded_data.append(bin(char_values[0])[2:].zfill(6))
-            index += 2
-        return bytes("".join(encoded_data), encoding='utf-8')
+        char_values = [_ALPHANUMERIC_VALUES.get(char) for char in input_str]
+        if None in char_values:
+            invalid_char = input_str[char_values.index(None)]
+            raise ValueError(f"Invalid character: {invalid_char}. Supported characters are alphanumeric characters and the symbols $, %, *, +, -, ., /,:, and space.")
+        bit_stream = QRCodeBitStream()
+        # each pair of characters takes 11 bits (45 * first value + second value); all the pairs are packed into a single value
+        pairs_bit_length = len(input_str) // 2 * 11
+        packed_pairs = 0
+        for first_value, second_value in zip(char_values[0::2], char_values[1::2]):
+            packed_pairs = (packed_pairs << 11) | (first_value * 45 + second_value)
+        bit_stream.extend_bits(packed_pairs, pairs_bit_length)
+        if len(input_str) % 2:
+            bit_stream.extend_bits(char_values[-1], 6)
+        return bit_stream.to_ascii()
     
     
     def encode_bytes(self, input_str: str, char_count_indicator: int, mode_indicator: bytes ) -> bytes:
@@ -217,16 +228,22 @@ class QRCodeEncoder:
         Returns:
             bytes: Encoded byte data as bytes.
         """
-        if char_count_indicator != self.get_char_count_indicator("BYTE"):
+        if char_count_indicator != CHAR_COUNT_BITS[QRCodeMode.BYTE]:
             raise ValueError("Invalid character count indicator for byte encoding.")
-        if mode_indicator != self.get_mode_indicator("BYTE"):
+        if mode_indicator != MODE_INDICATORS[QRCodeMode.BYTE]:
             raise ValueError("Invalid mode indicator for byte encoding.")
-        encoded_data = []
-        for char in input_str:
-            encoded_data.append(bin(ord(char))[2:].zfill(8))
-        input_length = bytes(bin(len(input_str))[2::], encoding='utf-8')
-        bits_char_count_indicator = bytes(bin(char_count_indicator)[2::].zfill(char_count_indicator), encoding='utf-8')
-        return mode_indicator + bits_char_count_indicator + input_length + bytes("".join(encoded_data), encoding='utf-8')
+        bit_stream = QRCodeBitStream()
+        bit_stream.extend_ascii(mode_indicator)
+        bit_stream.extend_bits(char_count_indicator, max(char_count_indicator, char_count_indicator.bit_length()))
+        bit_stream.extend_bits(len(input_str), max(1, len(input_str).bit_length()))
+        if input_str.isascii():
+            # byte aligned fast path: every character is a single byte, so the whole input is appended at once
+            bit_stream.extend_bytes(input_str.encode('ascii'))
+        else:
+            for char in input_str:
+                code_point = ord(char)
+                bit_stream.extend_bits(code_point, max(8, code_point.bit_length()))
+        return bit_stream.to_ascii()
 
 
     def encode_kanji(self, input_str: str, char_count_indicator: int, mode_indicator: bytes):
@@ -244,6 +261,7 @@ class QRCodeEncoder:
             - Add Least significant byte to product from the product above
             - convert the result to a 13-bit binary string
         after doing this to all the characters, prefix the string withthe character count indicator and mode indicator.
+        The 13-bit values of every Shift JIS value in both ranges are computed once, when the module is imported.
         Args:
             input_str (str): the input Kanji string
             char_count_indicator (int): The character count indicator for the corresponding mode (as per ISO)
@@ -255,36 +273,23 @@ class QRCodeEncoder:
         Returns:
             the encoded string as in Section 7.4.6 of the ISO
         """
-        LOWER_BOUND_BYTE_1 = 0x8140
-        UPPER_BOUND_BYTE_1 = 0x9ffc
-        LOWER_BOUND_BYTE_2 = 0xe040
-        UPPER_BOUND_BYTE_2 = 0xebbf
-        BASELINE_BOUND_2 = 0xc040
-        MULTIPLIER = 0xc0
-        encoded_data = []
         if len(input_str) % 2:
             raise ValueError("Invalid string format. Kanji encoding require two bytes per each character. Perhaps you forgot to encode as shift-jis?")
+        bit_stream = QRCodeBitStream()
+        bit_stream.extend_bits(char_count_indicator, max(1, char_count_indicator.bit_length()))
+        bit_stream.extend_ascii(mode_indicator)
+        kanji_codes = _KANJI_CODES
         for index in range(0, len(input_str), 2):
-            hex_bytes = int(input_str[index:index + 2].hex(), 16)
-            intermediate_sub = 0
-            if not(hex_bytes >= LOWER_BOUND_BYTE_1 and hex_bytes <= UPPER_BOUND_BYTE_1) and not(hex_bytes >= LOWER_BOUND_BYTE_2 and hex_bytes <= UPPER_BOUND_BYTE_2):
+            # the calculations above are precomputed for every Shift JIS value of both ranges (see _build_kanji_codes)
+            kanji_code = kanji_codes.get(input_str[index] << 8 | input_str[index + 1])
+            if kanji_code is None:
                 raise ValueError("Invalid string format")
-            if LOWER_BOUND_BYTE_1 <= hex_bytes <= UPPER_BOUND_BYTE_1: 
-                intermediate_sub = hex(hex_bytes - LOWER_BOUND_BYTE_1)[2:] # get rid of the 0x from the str representation
-            elif LOWER_BOUND_BYTE_2 <= hex_bytes <= UPPER_BOUND_BYTE_2:
-                intermediate_sub = hex(hex_bytes - BASELINE_BOUND_2)[2:]
-            intermediate_sub_msb = hex(int(intermediate_sub[0:2], 16))
-            intermediate_sub_lsb = hex(int(intermediate_sub[2:4], 16))
-            most_sig_byte_mult = hex(int(intermediate_sub_msb, 16) * MULTIPLIER)
-            add_lsb_to_mult = bin(int(most_sig_byte_mult, 16) + int(intermediate_sub_lsb, 16))[2:]
-            converted_bin_represent = bytes(add_lsb_to_mult.zfill(13), encoding='utf-8')
-            encoded_data.append(converted_bin_represent)
-        bin_char_count_indicator = bytes(bin(char_count_indicator)[2:], encoding='utf-8')
-        bin_encoded_data = bytes()
-        for data_part in encoded_data:
-            bin_encoded_data += data_part
-        return bin_char_count_indicator + mode_indicator + bin_encoded_data
+            bit_stream.extend_bits(kanji_code, 13)
+        return bit_stream.to_ascii()
     
+    # name of the encoding method of each mode, indexed by QRCodeMode (see encode_data_into_bit_stream)
+    _ENCODER_NAMES = ("encode_numeric", "encode_alphanumeric", "encode_bytes", "encode_kanji")
+
     def _add_terminator_and_padding(self, encoded_input: bytes) -> bytes:
         """
         Adds the specified terminator for the encoded data (See Table 2 of ISO). For modes different that any micro QR code (M1, M2, M3 and M4),
@@ -305,26 +310,18 @@ class QRCodeEncoder:
         """
         codeword_per_version_and_ecl = self.error_correction_level.get_numbers_of_bits_per_codewords(self.version)
         remainder_of_zeroes = codeword_per_version_and_ecl - len(encoded_input)
-        transformed_encoded_input = encoded_input
-        terminator_zeroes = bytes()
+        terminator_zeroes = b''
         if 0 < remainder_of_zeroes <= 4:
             # 1) add the codeword zeroes, up to 0000
-            terminator_zeroes = bytes("".join(["0" for _ in range(remainder_of_zeroes)]), encoding="utf-8")
-        transformed_encoded_input += terminator_zeroes
+            terminator_zeroes = b'0' * remainder_of_zeroes
         # 2) add the remainder of padding zeroes to fit a whole byte:
-        remainder_for_whole_byte = 8 - (len(transformed_encoded_input) % 8)
-        transformed_encoded_input += bytes("".join(["0" for _ in range(remainder_for_whole_byte)]), encoding="utf-8")
-        # 3) add the pad codewords if required:
-        PAD_CODEWORD_0 = bytes('11101100', encoding='utf-8')
-        PAD_CODEWORD_1 = bytes('00010001', encoding='utf-8')
-        counter = 0
-        while len(transformed_encoded_input) < codeword_per_version_and_ecl:
-            if counter % 2 == 0:
-                transformed_encoded_input += PAD_CODEWORD_0
-            else:
-                transformed_encoded_input += PAD_CODEWORD_1
-            counter += 1
-        return transformed_encoded_input
+        encoded_length = len(encoded_input) + len(terminator_zeroes)
+        remainder_for_whole_byte = 8 - (encoded_length % 8)
+        encoded_length += remainder_for_whole_byte
+        # 3) add the pad codewords if required, alternating both of them: the tail is a slice of the pad codewords of the whole symbol
+        pad_codewords = max(0, (codeword_per_version_and_ecl - encoded_length) // 8)
+        padding = _get_pad_codewords(codeword_per_version_and_ecl)[:pad_codewords * 8]
+        return b''.join((encoded_input, terminator_zeroes, b'0' * remainder_for_whole_byte, padding))
     
 
     def generate_blocks(self, encoded_input: bytes):
@@ -360,6 +357,10 @@ class QRCodeEncoder:
         # TODO dividir esse método em múltiplas chamadas refatoradas.
         # tem que ter mais dois métodos: um pra gerar o data codeword e outro que chama esses dois.
         codeword_block_structure = self.error_correction_level.get_number_and_struct_of_error_correction_blocks(self.version)
+        if len(encoded_input) % 8:
+            raise ValueError("Invalid encoded input. It must be made of whole codewords (8 bits each)")
+        # the bit string is parsed at once into packed codewords (one byte each); the blocks are then slices of it
+        encoded_codewords = int(encoded_input, 2).to_bytes(len(encoded_input) >> 3, "big") if encoded_input else b''
         offset = 0
         curr_block_no = 1
         total_block_data_codewords = []
@@ -376,17 +377,17 @@ class QRCodeEncoder:
             max_data_codeword_size = max(max_data_codeword_size, data_codewords)
             max_error_codeword_size = max(max_error_codeword_size, error_codewords)
             for block in range(num_blocks):
-                curr_block_data_coefficients = []
                 # add the data codewords of the encoded data into blocks.
-                offset_limit_for_block = curr_block_no * data_codewords * 8 # the upper bound of the number of codewords for the current block, in bits
-                while offset < offset_limit_for_block:
-                    curr_block_data_coefficients.append(int(encoded_input[offset:min(offset + 8, offset_limit_for_block)], 2))
-                    offset += 8
+                offset_limit_for_block = curr_block_no * data_codewords # the upper bound of the number of codewords for the current block
+                curr_block_data_coefficients = encoded_codewords[offset:offset_limit_for_block]
+                if len(curr_block_data_coefficients) < offset_limit_for_block - offset:
+                    raise ValueError(f"Not enough data codewords in the encoded input for version {self.version}")
+                offset = max(offset, offset_limit_for_block)
                 # this is where the error codeblocks are added.
                 # the step by step is a bit more difficult than it should be. In fact, you need to understand a bit better the log and antilog table
                 # to manipulate the exponents since the whole operation is divided in modulo 2 bytewise operation with 285 1001010
                 generator_polynomial = PolynomialOperations.generate_generator_polynomial(error_codewords)
-                data_polynomial = IntPolynomial([Term(coefficient, len(curr_block_data_coefficients) - exponent - 1) for exponent, coefficient in enumerate(curr_block_data_coefficients)])
+                data_polynomial = IntPolynomial.from_values(*curr_block_data_coefficients)
                 error_correction_codewords = PolynomialOperations.divide(data_polynomial, generator_polynomial)
                 total_block_data_codewords.append(curr_block_data_coefficients)
                 error_correction_coefficients = PolynomialOperations.get_int_values_from_alpha(error_correction_codewords)
@@ -408,7 +409,7 @@ class QRCodeEncoder:
                     # ignore the null position in the one with less data.
                     continue
                 resulting_blocks.append(total_block_error_codewords[block][col])
-        resulting_blocks_bin = [ bin(data)[2:].zfill(8) for data in resulting_blocks]
-        padding = ['0' for _ in range(self.get_remainder_bits())]
-        resulting_blocks_bin.append("".join(padding))
-        return bytes("".join(resulting_blocks_bin), encoding='utf-8')
+        bit_stream = QRCodeBitStream()
+        bit_stream.extend_bytes(bytes(resulting_blocks))
+        bit_stream.extend_bits(0, self.get_remainder_bits())
+        return bit_stream.to_ascii()
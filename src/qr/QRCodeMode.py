@@ -0,0 +1,42 @@
+"""Module to hold the encoding modes supported by the QR code encoder (sections 7.4.3 to 7.4.6 of ISO 18004)"""
+
+import enum
+
+# Table 2 of ISO 18004: mode indicator of each mode, indexed as MODE_INDICATORS[mode]
+MODE_INDICATORS = (b'0001', b'0010', b'0100', b'1000')
+
+# Table 3 of ISO 18004: number of bits of the character count indicator for versions 1 to 9, indexed as CHAR_COUNT_BITS[mode]
+CHAR_COUNT_BITS = (10, 9, 8, 8)
+
+
+class QRCodeMode(enum.IntEnum):
+    """
+    Enum representing the QR Code encoding modes.
+    The value of each member is its position in the tables above (and in QRCodeDataSize), so members index them directly.
+    """
+    NUMERIC = 0
+    ALPHANUMERIC = 1
+    BYTE = 2
+    KANJI = 3
+
+    def __str__(self):
+        return self.name
+
+    def get_mode_indicator(self) -> bytes:
+        """Returns the mode indicator of the mode as a bit string (e.g., b'0001' for NUMERIC)"""
+        return MODE_INDICATORS[self]
+
+    def get_char_count_indicator(self) -> int:
+        """Returns the number of bits of the character count indicator of the mode, for versions 1 to 9"""
+        return CHAR_COUNT_BITS[self]
+
+    @staticmethod
+    def from_name(name: str):
+        """Returns the mode for a name either in upper case (e.g., "NUMERIC") or as returned by QRCodeInputAnalyzer (e.g., "Numeric"),
+           or None if there is no such mode.
+        """
+        return _MODES_BY_NAME.get(name)
+
+
+# modes by name, so looking a mode up does not need to allocate an upper case copy of the name
+_MODES_BY_NAME = {name: mode for mode in QRCodeMode for name in (mode.name, mode.name.capitalize())}
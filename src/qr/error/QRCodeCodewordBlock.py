@@ -1,22 +1,23 @@
 """ Module to hold codeword block as a data class"""
 
-class QRCodeCodewordBlock:
+from typing import NamedTuple
+
+class QRCodeCodewordBlock(NamedTuple):
     """Class to model the last column of Table 9 from the ISO 18004.
+       Being a NamedTuple, each block is an immutable tuple (total, data, ecc) with C-level field access.
     """
-    def __init__(self, total_codewords: int, number_of_data_codewords: int, error_correction_capacity: int):
-        self._codewords = total_codewords #[None for _ in range(total_codewords)]
-        self._data_codewords = number_of_data_codewords #[None for _ in range(number_of_data_codewords)]
-        self._error_correction_capacity = error_correction_capacity
-        
-    
+    total: int  # total number of codewords of the block
+    data: int  # number of data codewords of the block
+    ecc: int  # error correction capacity of the block
+
     def data_codewords(self):
         """Getter method for the number of data codewords of a block"""
-        return self._data_codewords
+        return self.data
 
     def total_codewords(self):
         """Getter method for the total sum of codewords of a block"""
-        return self._codewords
-    
+        return self.total
+
     def error_correction_capacity(self):
         """Getter method to get the error correction capactiy (for completeness)"""
-        return self._error_correction_capacity
\ No newline at end of file
+        return self.ecc
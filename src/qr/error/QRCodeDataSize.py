@@ -1,51 +1,63 @@
 """Module to maintaint he QR Code data size based on the version 4 and the error correction level."""
 
 
-import enum
 from src.qr.error.QRErrorCorrectionLevel import QRErrorCorrectionLevel
+from src.qr.QRCodeMode import QRCodeMode
 
-class QRCodeDataSize(enum.Enum):
-    """
-    Enum representing the QR Code data sizes based on version and error correction level.
-    Args:
-        enum (QRErrorCorrectionLevel): enum type that model differnt error correction levels for QR codes.
-    """
+# data capacity per error correction level and encoding mode
+DATA_SIZE = {
+    "L" : {
+        "NUMERIC": 187,
+        "ALPHANUMERIC": 114,
+        "BYTE": 78,
+        "KANJI": 48
+    },
+    "M" : {
+        "NUMERIC": 149,
+        "ALPHANUMERIC": 90,
+        "BYTE": 62,
+        "KANJI": 38
+    },
+    "Q" : {
+        "NUMERIC": 111,
+        "ALPHANUMERIC": 67,
+        "BYTE": 46,
+        "KANJI": 28
+    },
+    "H" : {
+        "NUMERIC": 82,
+        "ALPHANUMERIC": 59,
+        "BYTE": 34,
+        "KANJI": 21
+    },
+}
 
-    DATA_SIZE = {
-        "L" : {
-            "NUMERIC": 187,
-            "ALPHANUMERIC": 114,
-            "BYTE": 78,
-            "KANJI": 48
-        },
-        "M" : {
-            "NUMERIC": 149,
-            "ALPHANUMERIC": 90,
-            "BYTE": 62,
-            "KANJI": 38
-        },
-        "Q" : {
-            "NUMERIC": 111,
-            "ALPHANUMERIC": 67,
-            "BYTE": 46,
-            "KANJI": 28
-        },
-        "H" : {
-            "NUMERIC": 82,
-            "ALPHANUMERIC": 59,
-            "BYTE": 34,
-            "KANJI": 21
-        },
-    }
+# same data as DATA_SIZE, flattened as _DATA_SIZE_FLAT[level * 4 + mode], in the order of QRCodeMode
+_DATA_SIZE_FLAT = tuple(DATA_SIZE[str(level)][mode.name] for level in QRErrorCorrectionLevel for mode in QRCodeMode)
 
-    @staticmethod
-    def get_data_size(error_correction_level: QRErrorCorrectionLevel, mode: str) -> int:
-        """
-        Get the data size for a specific error correction level and mode.
-        Args:
-            error_correction_level (QRErrorCorrectionLevel): The error correction level.
-            mode (str): The mode of the QR code (e.g., "NUMERIC", "ALPHANUMERIC", "BYTE", "KANJI").
-        """
-        return QRCodeDataSize.DATA_SIZE[error_correction_level.name][mode.upper()]
 
+def get_data_size(error_correction_level: QRErrorCorrectionLevel, mode: str | int) -> int:
+    """
+    Get the data size for a specific error correction level and mode.
+    Args:
+        error_correction_level (QRErrorCorrectionLevel): The error correction level.
+        mode (str | int): The mode of the QR code, in any case (e.g., "NUMERIC", "ALPHANUMERIC", "BYTE", "KANJI", or "Numeric"
+            as returned by QRCodeInputAnalyzer) or its index in that order (e.g., a QRCodeMode).
 
+    Raises:
+        KeyError: if there is no mode with that name.
+        ValueError: if the mode index is out of the range 0 to 3.
+    """
+    if isinstance(mode, str):
+        # the upper case and capitalised names are looked up as they are; only the other spellings need an upper case copy
+        mode_index = QRCodeMode.from_name(mode)
+        if mode_index is None:
+            mode_index = QRCodeMode.from_name(mode.upper())
+            if mode_index is None:
+                raise KeyError(mode)
+    else:
+        mode_index = mode
+        # the table is flat, so an index out of range would silently read the row of another error correction level
+        if not 0 <= mode_index < len(QRCodeMode):
+            raise ValueError(f"Invalid mode index {mode_index}. It must range from 0 to {len(QRCodeMode) - 1}")
+    return _DATA_SIZE_FLAT[error_correction_level * 4 + mode_index]
@@ -1,17 +1,112 @@
 import enum
 from src.qr.error.QRCodeCodewordBlock import QRCodeCodewordBlock as Block
 
-class QRErrorCorrectionLevel(enum.Enum):
+MAX_VERSION = 40
+
+# Table 7 of ISO 18004: number of data codewords, indexed as _DATA_CODEWORDS[version - 1][level]
+_DATA_CODEWORDS = (
+    (55, 44, 34, 26),         # 1
+    (55, 44, 34, 26),         # 2
+    (55, 44, 34, 26),         # 3
+    (80, 64, 48, 36),         # 4
+    (108, 86, 62, 46),        # 5
+    (136, 108, 76, 60),       # 6
+    (156, 124, 88, 66),       # 7
+    (194, 154, 110, 86),      # 8
+    (232, 182, 132, 100),     # 9
+    (274, 216, 154, 122),     # 10
+    (324, 254, 180, 140),     # 11
+    (370, 290, 206, 158),     # 12
+    (428, 334, 244, 180),     # 13
+    (461, 365, 261, 197),     # 14
+    (523, 415, 295, 223),     # 15
+    (589, 453, 325, 253),     # 16
+    (647, 507, 367, 283),     # 17
+    (721, 563, 397, 313),     # 18
+    (795, 627, 445, 341),     # 19
+    (861, 669, 485, 385),     # 20
+    (932, 714, 512, 406),     # 21
+    (1006, 782, 568, 442),    # 22
+    (1094, 860, 614, 464),    # 23
+    (1174, 914, 664, 514),    # 24
+    (1276, 1000, 718, 538),   # 25
+    (1370, 1062, 754, 596),   # 26
+    (1468, 1128, 808, 628),   # 27
+    (1531, 1193, 871, 661),   # 28
+    (1631, 1267, 911, 701),   # 29
+    (1735, 1373, 985, 745),   # 30
+    (1843, 1455, 1033, 793),  # 31
+    (1955, 1541, 1115, 845),  # 32
+    (2071, 1631, 1171, 901),  # 33
+    (2191, 1725, 1231, 961),  # 34
+    (2306, 1812, 1286, 986),  # 35
+    (2434, 1914, 1354, 1054), # 36
+    (2566, 1992, 1426, 1096), # 37
+    (2702, 2102, 1502, 1142), # 38
+    (2812, 2216, 1582, 1222), # 39
+    (2956, 2334, 1666, 1276), # 40
+)
+
+# number of bits of the data codewords, precomputed once as _DATA_CODEWORDS_BITS[version - 1][level]
+_DATA_CODEWORDS_BITS = tuple(tuple(data << 3 for data in data_per_level) for data_per_level in _DATA_CODEWORDS)
+
+# Table 1 of ISO 18004: total number of codewords, indexed as _TOTAL_CODEWORDS[version - 1]
+_TOTAL_CODEWORDS = (
+    26, 44, 70, 100, 134, 172, 196, 242, 292, 346,
+    404, 466, 532, 581, 655, 733, 815, 901, 991, 1085,
+    1156, 1258, 1364, 1474, 1588, 1706, 1828, 1921, 2051, 2185,
+    2323, 2465, 2611, 2761, 2876, 3034, 3196, 3362, 3532, 3706,
+)
+
+# error correction codewords (total - data), precomputed once as _ERROR_CORRECTION_CODEWORDS[version - 1][level]
+_ERROR_CORRECTION_CODEWORDS = tuple(
+    tuple(total - data for data in data_per_level)
+    for total, data_per_level in zip(_TOTAL_CODEWORDS, _DATA_CODEWORDS)
+)
+
+# Table 9 of ISO 18004: error correction block structure, indexed as _BLOCKS[version - 1][level]
+_BLOCKS = (
+    (((1, Block(26,19,2)),), ((1, Block(26,16,4)),), ((1, Block(26,13,6)),), ((1, Block(26,9,8)),)),  # 1
+    (((1, Block(44,34,4)),), ((1, Block(44,28,8)),), ((1, Block(44,22,11)),), ((1, Block(44,16,14)),)),  # 2
+    (((1, Block(70,55,7)),), ((1, Block(44,28,8)),), ((1, Block(44,22,11)),), ((1, Block(44,16,14)),)),  # 3
+    (((1, Block(100,80,10)),), ((2, Block(50,32,9)),), ((2, Block(50,24,13)),), ((4, Block(44,16,14)),)),  # 4
+    (((1, Block(134,108,13)),), ((2, Block(67,43,12)),),
+     ((2, Block(33,15,9)), (2, Block(34,16,9))), ((2, Block(33,11,9)), (2, Block(34,12,9)))),  # 5
+)
+
+
+def _check_version(version: int):
+    """Validates the QR code version once before indexing the tables above, which are indexed by version - 1.
+       Without it, version 0 would silently wrap around to the last row of a table.
+
+    Raises:
+        ValueError: if the version is not in the range 1 to 40
+    """
+    if not 1 <= version <= MAX_VERSION:
+        raise ValueError(f'Invalid QR code version {version}. Supported versions range from 1 to {MAX_VERSION}')
+
+
+class QRErrorCorrectionLevel(enum.IntEnum):
     """
     Enum representing the QR Code error correction levels.
+    The value of each member is its position in the rows of the tables above, so members index them directly.
     """
-    L = "L"  # Low (7% of codewords can be restored)
-    M = "M"  # Medium (15% of codewords can be restored)
-    Q = "Q"  # Quartile (25% of codewords can be restored)
-    H = "H"  # High (30% of codewords can be restored)
+    L = 0  # Low (7% of codewords can be restored)
+    M = 1  # Medium (15% of codewords can be restored)
+    Q = 2  # Quartile (25% of codewords can be restored)
+    H = 3  # High (30% of codewords can be restored)
 
     def __str__(self):
-        return self.value
+        return self.name
+
+    @classmethod
+    def _missing_(cls, value):
+        """Accepts the letter of the level (e.g., QRErrorCorrectionLevel("L")), which was the value of each member before they became
+           the table positions. Note that .value is the position now; use .name (or str()) for the letter.
+        """
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
     
     
     def get_number_of_data_codewords(self, version: int):
@@ -20,49 +115,8 @@ class QRErrorCorrectionLevel(enum.Enum):
         Args:
             version (int): version of the QR code being generated.
         """
-        codeword_map = {
-            1:  {'L': 55,  'M': 44,  'Q': 34,  'H': 26},
-            2:  {'L': 55,  'M': 44,  'Q': 34,  'H': 26},
-            3:  {'L': 55,  'M': 44,  'Q': 34,  'H': 26},
-            4:  {'L': 80,  'M': 64,  'Q': 48,  'H': 36},
-            5:  {'L': 108, 'M': 86,  'Q': 62,  'H': 46},
-            6:  {'L': 136, 'M': 108, 'Q': 76,  'H': 60},
-            7:  {'L': 156, 'M': 124, 'Q': 88,  'H': 66},
-            8:  {'L': 194, 'M': 154, 'Q': 110, 'H': 86},
-            9:  {'L': 232, 'M': 182, 'Q': 132, 'H': 100},
-            10: {'L': 274, 'M': 216, 'Q': 154, 'H': 122},
-            11: {'L': 324, 'M': 254, 'Q': 180, 'H': 140},
-            12: {'L': 370, 'M': 290, 'Q': 206, 'H': 158},
-            13: {'L': 428, 'M': 334, 'Q': 244, 'H': 180},
-            14: {'L': 461, 'M': 365, 'Q': 261, 'H': 197},
-            15: {'L': 523, 'M': 415, 'Q': 295, 'H': 223},
-            16: {'L': 589, 'M': 453, 'Q': 325, 'H': 253},
-            17: {'L': 647, 'M': 507, 'Q': 367, 'H': 283},
-            18: {'L': 721, 'M': 563, 'Q': 397, 'H': 313},
-            19: {'L': 795, 'M': 627, 'Q': 445, 'H': 341},
-            20: {'L': 861, 'M': 669, 'Q': 485, 'H': 385},
-            21: {'L': 932, 'M': 714, 'Q': 512, 'H': 406},
-            22: {'L': 1006,'M': 782, 'Q': 568, 'H': 442},
-            23: {'L': 1094,'M': 860, 'Q': 614, 'H': 464},
-            24: {'L': 1174,'M': 914, 'Q': 664, 'H': 514},
-            25: {'L': 1276,'M': 1000,'Q': 718, 'H': 538},
-            26: {'L': 1370,'M': 1062,'Q': 754, 'H': 596},
-            27: {'L': 1468,'M': 1128,'Q': 808, 'H': 628},
-            28: {'L': 1531,'M': 1193,'Q': 871, 'H': 661},
-            29: {'L': 1631,'M': 1267,'Q': 911, 'H': 701},
-            30: {'L': 1735,'M': 1373,'Q': 985, 'H': 745},
-            31: {'L': 1843,'M': 1455,'Q': 1033,'H': 793},
-            32: {'L': 1955,'M': 1541,'Q': 1115,'H': 845},
-            33: {'L': 2071,'M': 1631,'Q': 1171,'H': 901},
-            34: {'L': 2191,'M': 1725,'Q': 1231,'H': 961},
-            35: {'L': 2306,'M': 1812,'Q': 1286,'H': 986},
-            36: {'L': 2434,'M': 1914,'Q': 1354,'H': 1054},
-            37: {'L': 2566,'M': 1992,'Q': 1426,'H': 1096},
-            38: {'L': 2702,'M': 2102,'Q': 1502,'H': 1142},
-            39: {'L': 2812,'M': 2216,'Q': 1582,'H': 1222},
-            40: {'L': 2956,'M': 2334,'Q': 1666,'H': 1276},
-        }
-        return codeword_map[version][str(self)]
+        _check_version(version)
+        return _DATA_CODEWORDS[version - 1][self]
     
     def get_numbers_of_bits_per_codewords(self, version: int) -> int:
         """
@@ -73,7 +127,8 @@ class QRErrorCorrectionLevel(enum.Enum):
         Returns:
             int: _description_
         """
-        return self.get_number_of_data_codewords(version) * 8
+        _check_version(version)
+        return _DATA_CODEWORDS_BITS[version - 1][self]
     
     def get_total_number_of_codewords(self, version: int):
         """Method to implement the retrieval of the total of codewords"
@@ -81,126 +136,47 @@ class QRErrorCorrectionLevel(enum.Enum):
         Args:
             version (int): QR code version 
         """
-        total_codewords = {
-            1: 26,
-            2: 44,
-            3: 70,
-            4: 100,
-            5: 134,
-            6: 172,
-            7: 196,
-            8: 242,
-            9: 292,
-            10: 346,
-            11: 404,
-            12: 466,
-            13: 532,
-            14: 581,
-            15: 655,
-            16: 733,
-            17: 815,
-            18: 901,
-            19: 991,
-            20: 1085,
-            21: 1156,
-            22: 1258,
-            23: 1364,
-            24: 1474,
-            25: 1588,
-            26: 1706,
-            27: 1828,
-            28: 1921,
-            29: 2051,
-            30: 2185,
-            31: 2323,
-            32: 2465,
-            33: 2611,
-            34: 2761,
-            35: 2876,
-            36: 3034,
-            37: 3196,
-            38: 3362,
-            39: 3532,
-            40: 3706
-        }
-        return total_codewords[version]
+        _check_version(version)
+        return _TOTAL_CODEWORDS[version - 1]
         
     def get_number_of_error_correction_codewords(self, version: int):
         """Method to retrieve the number of error correction codewords. there are two possibilites to do so:
             1) encode table 9 from ISO, or
             2) derive from the total number of codewords and the number of data codewords
+           Option 2 is precomputed at import time in _ERROR_CORRECTION_CODEWORDS.
         Args:
             version (int): QR code version
         """
-        return self.get_total_number_of_codewords(version) - self.get_number_of_data_codewords(version)
+        _check_version(version)
+        return _ERROR_CORRECTION_CODEWORDS[version - 1][self]
     
     def get_number_and_struct_of_error_correction_blocks(self, version: int):
         """Method to retrieve the number of error correction blocks (ecb) per QR Code version. According to the ISO, in table 9, the last two columns
            define the structure of how many codewords and how they are distributed per number of blocks.
-           Table 9 is modelled as the dictionary below with the following structure:
-           {
-               version: {
-                   <error_correction_level>: [(<no_of_blocks>, (<total_codewords_per_block>, <data_codewords_per_block>, <error_correction_capacity>))]
-               }
-           }
+           Table 9 is modelled as the module constant _BLOCKS, built once at import, with the following structure:
+           (
+               # version
+               (
+                   # one entry per error correction level, in the order L, M, Q, H
+                   ((<no_of_blocks>, (<total_codewords_per_block>, <data_codewords_per_block>, <error_correction_capacity>)),)
+               )
+           )
            This means that for a specific version and error correction level, one can retrieve how many blocks we need to have and each block's structure. From the ISO, 
-           for a given pair (version, error correction level) there will be at most two groups. Therefore, the modelling of the dictionary below will have values with an array
+           for a given pair (version, error correction level) there will be at most two groups. Therefore, the modelling of the table will have values with a tuple
            of length at most two to hold the information of how many blocks and their corresponding structure.
+           Being immutable, the returned structure can be shared and cached by the callers.
            As an example:
 
-            4: {"L": [(1, (100,80,10))], "M": [(2, (50,32,9))], "Q": [(2, (50,24,13))], "H": [(4, (44,16,14))]},
+            (((1, Block(100,80,10)),), ((2, Block(50,32,9)),), ((2, Block(50,24,13)),), ((4, Block(44,16,14)),)),  # 4
             for version 4, error correction level M we'll have two blocks, where each block will have 50 codewords, 32 of data and 18 for error. adding everything we have:
             100 codewords, 64 data codewords and 36 error correction codewords, just like the ISO.
 
+           Only versions 1 to 5 of Table 9 are modelled so far; any other version raises a ValueError.
+
         Args:
             version (int): QR code version
         """
         #TODO THIS IS NOT COMPLETE!!!
-        if version > 5:
+        if not 1 <= version <= len(_BLOCKS):
             raise ValueError(f'{version} still not implemented. Please contact the system administratior for more clarifications')
-        blocks_and_ecc_per_block = {
-            1: {"L": [(1, Block(26,19,2))], "M": [(1, Block(26,16,4))], "Q": [(1, Block(26,13,6))], "H": [(1, Block(26,9,8))]},
-            2: {"L": [(1, Block(44,34,4))], "M": [(1, Block(44,28,8))], "Q": [(1, Block(44,22,11))], "H": [(1, Block(44,16,14))]},
-            3: {"L": [(1, Block(70,55,7))], "M": [(1, Block(44,28,8))], "Q": [(1, Block(44,22,11))], "H": [(1, Block(44,16,14))]},
-            4: {"L": [(1, Block(100,80,10))], "M": [(2, Block(50,32,9))], "Q": [(2, Block(50,24,13))], "H": [(4, Block(44,16,14))]},
-            5: {"L": [(1, Block(134,108,13))], 
-                "M": [(2, Block(67,43,12))], 
-                "Q": [(2, Block(33,15,9)), (2, Block(34,16,9))], 
-                "H": [(2, Block(33,11,9)), (2, Block(34,12,9))]},
-            6: 172,
-            7: 196,
-            8: 242,
-            9: 292,
-            10: 346,
-            11: 404,
-            12: 466,
-            13: 532,
-            14: 581,
-            15: 655,
-            16: 733,
-            17: 815,
-            18: 901,
-            19: 991,
-            20: 1085,
-            21: 1156,
-            22: 1258,
-            23: 1364,
-            24: 1474,
-            25: 1588,
-            26: 1706,
-            27: 1828,
-            28: 1921,
-            29: 2051,
-            30: 2185,
-            31: 2323,
-            32: 2465,
-            33: 2611,
-            34: 2761,
-            35: 2876,
-            36: 3034,
-            37: 3196,
-            38: 3362,
-            39: 3532,
-            40: 3706
-        }
-        return blocks_and_ecc_per_block[version][str(self)]
\ No newline at end of file
+        return _BLOCKS[version - 1][self]
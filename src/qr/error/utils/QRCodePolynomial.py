@@ -2,21 +2,23 @@
     and all polynomial-related operations with the encoding
 """
 
-import math
-from collections import defaultdict
+from functools import lru_cache
 from typing import List
 from abc import ABC, abstractmethod
 
 class Alpha:
-    """Class modelling the alpha notation for Galois Field GF(256)
+    """Class modelling the alpha notation for Galois Field GF(256).
+       Polynomials do not store Alpha objects (see Polynomial), they are only created when terms are read or built through the API.
     """
 
-    _MAX_GF_256_EXPONENT = 255
+    __slots__ = ("_exponent",)
+
+    # order of the multiplicative group of GF(256): a^255 = a^0
+    _GF_256_ORDER = 255
 
     def __init__(self, exponent: int):
-        if exponent > self._MAX_GF_256_EXPONENT:
-            exponent = exponent % 256 + math.floor(exponent / 256)
-        self._exponent = exponent
+        # a single modulo, with no branch. Note the group order is 255, not 256 (e.g., a^256 = a^1)
+        self._exponent = exponent % self._GF_256_ORDER
         
     def __str__(self):
         return f'a^{self._exponent}'
@@ -24,68 +26,115 @@ class Alpha:
     def get_exponent(self) -> int:
         return self._exponent
 
+def _build_gf_256_tables():
+    """Builds the exponential (alpha exponent -> integer) and logarithm (integer -> alpha exponent) tables of GF(256).
+       The exponential table is doubled to 512 entries, so the sum of two exponents (at most 254 + 254) can be looked up
+       without normalizing it back to 0 <= i < 255 first.
+    """
+    exp_table = bytearray(512)
+    log_table = bytearray(256)
+    value = 1
+    for exponent in range(255):
+        exp_table[exponent] = exp_table[exponent + 255] = value
+        log_table[value] = exponent
+        value <<= 1
+        if value >= 256:
+            value ^= 0b100011101
+    exp_table[510] = exp_table[0]
+    return bytes(exp_table), bytes(log_table)
+
+_GF_256_EXP, _GF_256_LOG = _build_gf_256_tables()
+
+def _build_gf_256_multiplication_table():
+    """Builds the full GF(256) multiplication table as a flat 64 KB bytes object: the product a * b is at index (a << 8) | b,
+       so row a (the products of a by every value) is the contiguous slice [a << 8, (a + 1) << 8).
+    """
+    multiplication_table = bytearray(65536)
+    for a in range(1, 256):
+        log_a = _GF_256_LOG[a]
+        row = a << 8
+        multiplication_table[row + 1:row + 256] = bytes(_GF_256_EXP[log_a + _GF_256_LOG[b]] for b in range(1, 256))
+    return bytes(multiplication_table)
+
+_GF_256_MUL = _build_gf_256_multiplication_table()
+
+# generator polynomials for every number of error correction codewords per block used by the ISO (versions 1 to 40), as listed in Annex A
+# of ISO 18004: alpha exponents of the coefficients, from x^n down to x^0
+_ISO_GENERATOR_POLYNOMIALS = {
+    7: (0, 87, 229, 146, 149, 238, 102, 21),
+    10: (0, 251, 67, 46, 61, 118, 70, 64, 94, 32, 45),
+    13: (0, 74, 152, 176, 100, 86, 100, 106, 104, 130, 218, 206, 140, 78),
+    15: (0, 8, 183, 61, 91, 202, 37, 51, 58, 58, 237, 140, 124, 5, 99, 105),
+    16: (0, 120, 104, 107, 109, 102, 161, 76, 3, 91, 191, 147, 169, 182, 194, 225, 120),
+    17: (0, 43, 139, 206, 78, 43, 239, 123, 206, 214, 147, 24, 99, 150, 39, 243, 163, 136),
+    18: (0, 215, 234, 158, 94, 184, 97, 118, 170, 79, 187, 152, 148, 252, 179, 5, 98, 96, 153),
+    20: (0, 17, 60, 79, 50, 61, 163, 26, 187, 202, 180, 221, 225, 83, 239, 156, 164, 212, 212, 188, 190),
+    22: (0, 210, 171, 247, 242, 93, 230, 14, 109, 221, 53, 200, 74, 8, 172, 98, 80, 219, 134, 160, 105, 165, 231),
+    24: (0, 229, 121, 135, 48, 211, 117, 251, 126, 159, 180, 169, 152, 192, 226, 228, 218, 111, 0, 117, 232, 87, 96, 227, 21),
+    26: (0, 173, 125, 158, 2, 103, 182, 118, 17, 145, 201, 111, 28, 165, 53, 161, 21, 245, 142, 13, 102, 48, 227, 153, 145, 218, 70),
+    28: (0, 168, 223, 200, 104, 224, 234, 108, 180, 110, 190, 195, 147, 205, 27, 232, 201, 21, 43, 245, 87, 42, 195, 212, 119, 242, 37, 9, 123),
+    30: (0, 41, 173, 145, 152, 216, 31, 179, 182, 50, 48, 110, 86, 239, 96, 222, 125, 42, 173, 226, 193, 224, 130, 156, 37, 251, 216, 238, 40, 192, 180),
+}
+
+# same polynomials as dense integer coefficients indexed by x exponent (see Polynomial), ready to be wrapped without any arithmetic
+_GENERATOR_POLYNOMIALS = { n: bytes(_GF_256_EXP[exponent] for exponent in reversed(exponents)) for n, exponents in _ISO_GENERATOR_POLYNOMIALS.items() }
+
 class AlphaOperations:
     """Class to model the Alpha Operations like Log and Antilog to determine exponent & integer based on the operation,
        but that does not belong to an Alpha instance itself.
+       The class is stateless: both operations are lookups in the module level tables (_GF_256_EXP and _GF_256_LOG),
+       which are built once when the module is imported.
     """
-    #TODO this class needs to be globally avalable for all classes that manipula this.
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(AlphaOperations, cls).__new__(cls)
-        return cls._instance
-        
-    def __init__(self):
-        self._log_table = self.initialize_log_table()
-        self._antilog_table = self.initialize_antilog_table()
-    
-    def initialize_log_table(self):
-        """ Method to statically store the log table used to calculate Alpha exponents in Galois Field of 255 GF(255)
-        """
-        PRIMITIVE_POLYNOMIAL = 0b100011101
-        log_table_value = {0 : 1}
-        value = 1
-        for i in range(256):
-            log_table_value[i] = value
-            value = value << 1
-            if value >= 256:
-                value = value ^ PRIMITIVE_POLYNOMIAL 
-        return log_table_value
-
-    def get_log_from_alpha(self,  exponent: int):
-        return self._log_table[exponent]
-
-    def initialize_antilog_table(self):
-        """Method to store the antilog table used to calculate integer back to the alpha exponents
-           based on the log operation initialized in method initialize_log_table, we can calculate back
-           by applying the definition of antilog : a^x = b, then antilog of a is x.
-           once the log table is calculated, it's a matter of applying the antilog operation by inverting 
-        Raises:
-            ValueError: Raised when the value is outside of possible integers in a Galois field GF(255): 1 <= integer <= 255
 
-        Returns:
-            antilog_table_value: Table containing the conversion of integers back to Alpha notation and its coefficients
-        """
-        calculation_antilog_table = {}
-        for key, value in self._log_table.items():
-            calculation_antilog_table[value] = key
-        # fix: normalization of exponent to match 1 back to 0
-        calculation_antilog_table[1] = 0
-        antilog_table = {}
-        # the for below can be extinguished, but this is just for the sake of readability.
-        for exponent in range(1, 256):
-            antilog_table[exponent] = calculation_antilog_table[exponent]
-        return antilog_table
-
-    def get_antilog_from_alpha(self, exponent: int):
-        return self._antilog_table[exponent] if exponent > 0 else 0
+    @staticmethod
+    def get_log_from_alpha(exponent: int):
+        return _GF_256_EXP[exponent]
+
+    @staticmethod
+    def get_antilog_from_alpha(exponent: int):
+        return _GF_256_LOG[exponent] if exponent > 0 else 0
+
+def _reduce_by_generator(dividend: bytes, divisor: bytes, k: int) -> bytearray:
+    """Computes the remainder of dividend * x^k by a monic polynomial of degree k (Steps 2 to 4 of PolynomialOperations.divide), with the
+       synthetic (Horner) division used by Reed-Solomon encoders: the remainder is kept as a single k bytes register, and each coefficient
+       of the dividend, from the highest x exponent down, is shifted into it.
+       It only works with flat buffers, integers and the GF(256) tables, so it does not depend on the polynomial classes.
+
+    Args:
+        dividend (bytes): integer coefficients of the dividend indexed by x exponent.
+        divisor (bytes): integer coefficients of the divisor indexed by x exponent, without its lead term (i.e., x^0 to x^(k - 1)).
+        k (int): degree of the divisor (i.e., the number of error codewords).
+
+    Returns:
+        bytearray: the k coefficients of the remainder, indexed by x exponent.
+
+    Raises:
+        ValueError: if k is lower than 1 (PolynomialOperations.divide validates its divisor before calling this function).
+    """
+    if k < 1:
+        raise ValueError(f"The divisor must have degree 1 or higher, but it has degree {k}")
+    multiplication_table = _GF_256_MUL
+    # the register holds the coefficient of x^i in its i-th byte (little endian, as the buffers), so multiplying it by x is a shift by 8 bits
+    register = 0
+    register_mask = (1 << (k << 3)) - 1
+    lead_shift = (k - 1) << 3
+    for x_exponent in range(len(dividend) - 1, -1, -1):
+        # lead term of the current step: the next coefficient of the dividend plus what the previous steps left in x^(k - 1)
+        lead_coefficient = dividend[x_exponent] ^ (register >> lead_shift)
+        register = (register << 8) & register_mask
+        if lead_coefficient:
+            # multiply the divisor by the lead term and XOR it with the dividend. The lead terms cancel out,
+            # so only the lower terms of the divisor are XOR'd, all of them at once (see PolynomialOperations.multiply)
+            register ^= int.from_bytes(divisor.translate(multiplication_table[lead_coefficient << 8:(lead_coefficient + 1) << 8]), "little")
+    return bytearray(register.to_bytes(k, "little"))
 
 class Term:
     """Class to model a term of the polynomial. 
        This class needs to have both the alpha exponent and the x exponent
     """
 
+    __slots__ = ("coefficient", "_x_exponent")
+
     def __init__(self, coefficient: Alpha | int, x_exponent: int):
         if (not isinstance(coefficient, int)) and (not isinstance(coefficient, Alpha) or coefficient.get_exponent() < 0 or x_exponent < 0):
             raise ValueError(f"Illegal values for eiher {coefficient} or {x_exponent}")
@@ -104,8 +153,16 @@ class Term:
 class Polynomial(ABC):
     """Abstract class to model polynomials. In our scenario, polynomials can be in integer notation or using alpha notation to denote each coefficient
        of the polynomial.
+       Regardless of the notation, the coefficients are stored densely as their GF(256) integer value in a bytearray indexed by the x exponent
+       (i.e., self._coefficients[i] is the coefficient of x^i, 0 meaning there is no such term). The notation only matters at the API boundaries,
+       where the terms are converted from/to Term objects (see get_coefficients).
+       As a consequence of this representation, a polynomial is always kept in its reduced form:
+       - terms with the same x exponent are added when the polynomial is built, which in GF(256) is a XOR of their integer values;
+       - terms whose coefficient is (or adds up to) 0 are not part of the polynomial;
+       - get_coefficients (and iterating over the polynomial) returns the terms from the highest x exponent down to x^0, whatever the order
+         they were given in.
     """
-    coefficients: None
+    _coefficients: bytearray
 
     def __init__(self, *args):
         """Allows the construction of a polynomial using either a list of coefficients or scalars.
@@ -113,46 +170,92 @@ class Polynomial(ABC):
            1) a List of Terms (pairs (Alpha, integer) as in class Term)
            2) a single Term 
            3) a sequence of Terms (Alpha, Integer)
-           Anything different from this will be ignored.
+           Anything different from this will be ignored. See IntPolynomial.from_values to build a polynomial from its integer values.
         """
+        terms = []
         if len(args) == 1:
             val = args[0]
             if isinstance(val, list):
                 self._validate_coefficient_list(val)
-                self.coefficients = val
+                terms = val
             elif isinstance(val, Term):
-                self.coefficients = [val]
+                terms = [val]
         else:
-            coefficients = []
             for elem in args:
                 self._validate_single_coefficient(elem)
-                coefficients.append(elem)
-            self.coefficients = coefficients
+            terms = args
+        for term in terms:
+            # Term does not validate the x exponent of integer coefficients, and a negative one would index the buffer from its end
+            if term.get_x_exponent() < 0:
+                raise ValueError(f"Illegal x exponent {term.get_x_exponent()} for term {term}. It must be 0 or higher")
+        coefficients = bytearray(max((term.get_x_exponent() for term in terms), default=-1) + 1)
+        for term in terms:
+            # terms with the same x exponent are added, which in GF(256) is a XOR
+            coefficients[term.get_x_exponent()] ^= self._to_field_element(term.get_coefficient())
+        self._coefficients = coefficients
+
+    @classmethod
+    def _from_coefficients(cls, coefficients: bytearray | bytes):
+        """Builds a polynomial straight from its dense representation (see the class docstring), without going through Term objects.
+           The bytearray is owned by the new polynomial afterwards.
+        """
+        polynomial = cls.__new__(cls)
+        polynomial._coefficients = coefficients
+        return polynomial
 
     def get_coefficients(self):
-        """Method to retrieve a list of coefficients of the polynomial
+        """Method to retrieve a list of coefficients of the polynomial, from the highest x exponent down to x^0. Terms with a null coefficient
+           are not part of the list.
         
         Returns:
-            self._coefficients (List[Alpha | int]): List of coefficients of the polynomial. The exact type depends on the concrete class
+            self._coefficients (List[Term]): List of terms of the polynomial. The exact type of each coefficient depends on the concrete class
+        """
+        return list(self)
+
+    def __iter__(self):
+        """Yields the terms of the polynomial on demand, from the highest x exponent down to x^0, skipping the null coefficients.
+           The x exponent of each term is its index in the coefficient buffer, so Term objects only exist while they are being read.
         """
-        return self.coefficients
+        coefficients = self._coefficients
+        for x_exponent in range(len(coefficients) - 1, -1, -1):
+            if coefficients[x_exponent]:
+                yield self._to_term(coefficients[x_exponent], x_exponent)
 
     @abstractmethod
     def _validate_single_coefficient(self, elem):
         pass
 
+    @abstractmethod
+    def _to_field_element(self, coefficient) -> int:
+        """Converts the coefficient of a Term to its integer value in GF(256)"""
+
+    @abstractmethod
+    def _to_term(self, value: int, x_exponent: int) -> Term:
+        """Converts an integer value in GF(256) back to a Term in the notation of the concrete class"""
+
     def _validate_coefficient_list(self, coefficient_list: List[Term]):
         for term in coefficient_list:
             if not isinstance(term, Term):
                 raise ValueError(f'{term} has incorrect type. It should be an instance of Term, but it is an instance of {type(term)}')
     
+    def __eq__(self, other):
+        """Two polynomials are equal when they have the same notation and the same terms. The comparison is done on the coefficient buffers,
+           ignoring the null coefficients of the highest x exponents (e.g., the ones left by xor_int or divide), so no Term is built.
+        """
+        if type(self) is not type(other):
+            return NotImplemented
+        return self._coefficients.rstrip(b'\0') == other._coefficients.rstrip(b'\0')
+
+    # polynomials built from a bytearray are mutable, so they are not hashable
+    __hash__ = None
+
     def __str__(self):
         """Pretty printer for printing a polynomial in a friendly format: a^i * x^n + a^j * x^(n - 1) + ... + a^z * x^0
         
         Returns:
             (str) : a string containing all terms that are part of the coefficient
         """
-        return " + ".join([str(term) for term in self.coefficients])
+        return " + ".join([str(term) for term in self])
 
 class AlphaPolynomial(Polynomial):
     """Class to model a Polynomial as a list of coefficients of the form Alpha(x), 3).
@@ -165,14 +268,42 @@ class AlphaPolynomial(Polynomial):
         if not isinstance(elem, Term):
             raise ValueError(f"{elem} is not a valid coefficient for a Polynomial in GF(255)")
 
+    def _to_field_element(self, coefficient: Alpha) -> int:
+        if not isinstance(coefficient, Alpha):
+            raise ValueError(f"{coefficient} is not a valid coefficient for a Polynomial in GF(255)")
+        return _GF_256_EXP[coefficient.get_exponent()]
+
+    def _to_term(self, value: int, x_exponent: int) -> Term:
+        return Term(Alpha(_GF_256_LOG[value]), x_exponent)
+
 class IntPolynomial(Polynomial):
     """Class to model an integer polynomial (i.e., integer coefficients), complementing the Alpha polynomial implementation
        This will be further used in the data codeword creation.
     """
 
-    def _validate_single_coefficient(self, elem: int):
-        if not isinstance(elem, int):
-            raise ValueError(f"{elem} is not a valid integer to form a data codeword")
+    @classmethod
+    def from_values(cls, *values: int):
+        """Builds an integer polynomial from its coefficients, from the highest x exponent down to x^0 (e.g., the data codewords of a block,
+           in order). Null values are kept as absent terms, like in the constructor.
+
+        Raises:
+            ValueError: if any of the values is not an integer from 0 to 255
+        """
+        polynomial = cls.__new__(cls)
+        polynomial._coefficients = bytearray(polynomial._to_field_element(value) for value in reversed(values))
+        return polynomial
+
+    def _validate_single_coefficient(self, elem: Term):
+        if not isinstance(elem, Term) or not isinstance(elem.get_coefficient(), int):
+            raise ValueError(f"{elem} is not a valid term with an integer to form a data codeword")
+
+    def _to_field_element(self, coefficient: int) -> int:
+        if not isinstance(coefficient, int) or not 0 <= coefficient <= 255:
+            raise ValueError(f"{coefficient} is not a valid integer to form a data codeword")
+        return coefficient
+
+    def _to_term(self, value: int, x_exponent: int) -> Term:
+        return Term(value, x_exponent)
 
 class PolynomialOperations:
     """Class to model all polynomial opreations required in section 7.5.2 to create the error codewords based on the ISO Specification
@@ -188,19 +319,22 @@ class PolynomialOperations:
 
     GF_255_PRIME_MODULUS_POLYNOMIAL = 285
 
-    GF_255_XOR_CACHE = {}
+    # GF(256) multiplication table, indexed by (a << 8) | b (see _build_gf_256_multiplication_table)
+    GF_256_MUL_TABLE = _GF_256_MUL
+
+    # deprecated: former name of GF_256_MUL_TABLE, kept for code outside this package that still reads it
+    GF_255_XOR_CACHE = GF_256_MUL_TABLE
 
     @staticmethod
     def divide(dividend: IntPolynomial, divisor: AlphaPolynomial):
         """Long polynomial division in the mathematical sense. In the QR code ISO 18004,
            this is required to create the error codewords as the remainder of the division of 
            the data codeword polynomial by the generator polynomial.
-           The steps will follow the procedure required as follows:
-           1) convert an IntPolynomial's coefficients to an AlphaPolynomial to integer to perform the multiplication step to get both polynomials with the
-              same coefficient for the lead term
+           The steps will follow the procedure required as follows, as a synthetic division over a single remainder register (see _reduce_by_generator):
+           1) multiply the data codeword polynomial by x^k, k being the number of error codewords
            2) Multiply the generator polynomial by the coefficient of lead term of the data codeword. Ex.: if the lead term is 50 * x^10, multiply the
               generator polynomial by 50 in alpha notation (remember: alpha notation adds exponents and it's easier to maintain within the GF(255))
-           3) convert the data polynomial back to int notation
+           3) convert the result back to int notation
            4) instead of adding the resulting polynomial's coefficients, we will apply XOR as the operation in GF(255)
               at this moment, the lead term will have the same value in both coefficients. Having them XOR'd will 
               give a coefficient of 0, effectively leading to the term being discarded
@@ -212,45 +346,36 @@ class PolynomialOperations:
                     In this case, will be called with the data codeword polynomial
             divisor (AlphaPolynomial): divisor of the operation. 
                     In this case, it will be called with the generator codeword polynomial.
+
+        Raises:
+            ValueError: if the divisor is null (empty, or all its terms cancel out) or has degree 0.
         """
         if not isinstance(dividend, IntPolynomial) or not isinstance(divisor, AlphaPolynomial):
             raise ValueError("Polynomial division is only supported with \
                              IntPolynomial and a AlphaPolynomial")
-        # Step 1a: Multiply the generator polynomial by the coefficient lead term
-        # of the message (data) polynomial (remember, long polynomial division)
-        # will want us to divide the data codeword by the generator polynomial, so the lead terms have the same coefficient (they need)
-        # we first convert the data codewords generated to a polynomial to perform long polynomial division:
-        # we will normalize the multiplication in Alpha notation so multiplying factors become a matter of adding
-        # # exponents of the coefficients
-        # this is required to normalize the exponent of the data codeword with the error codeword, to avoid the lead term to be too small
-        # during the division process. Shout out to Thonky for the heads up
-        # this is also noted in Section 7.5.2 of the ISO.
-        data_polynomial_alpha_notation = PolynomialOperations.convert_int_to_alpha(dividend)
-        error_codeword_max_exponent = len(divisor.get_coefficients()) - 1
-        x_exponent_normalizer = AlphaPolynomial(Term(Alpha(0),error_codeword_max_exponent))
-        data_codewords_polynomial = PolynomialOperations.multiply(data_polynomial_alpha_notation, x_exponent_normalizer)
-        divisor_data_codewords_qty = len(dividend.get_coefficients())
-        difference_generator_and_data_codewords = data_codewords_polynomial.get_coefficients()[0].get_x_exponent() - error_codeword_max_exponent
-        for division in range(0, divisor_data_codewords_qty):
-            # note: at each step of the division, the coefficients of the ORIGINAL generated polynomial will be used in the 
-            # NORMALIZED generator polynomial (i.e., the one multiplied by x^k, where k is the lead exponent of
-            # the message polynomial after x^n
-            divisor_generator_polynomial = PolynomialOperations.multiply(divisor, AlphaPolynomial(Term(Alpha(0), difference_generator_and_data_codewords - division)))
-            # at this point, both polynomials will have the same first n x exponents, where n is the number of error codewords.
-            # we can start the multiplication procedure which is part of the long polynomial divisor (so we can discard the lead term):
-            # the following step needs to be done number of data codewords times (with respect to Step 2)
-            # multiply the generator polynomial by the lead term in the data polynomial. both are already in Alpha notation at this point, so no problem:
-            data_codewords_polynomial_lead = data_codewords_polynomial.get_coefficients()[0]
-            lead_coefficient_alpha = data_codewords_polynomial_lead.get_coefficient()
-            divisor_generator_polynomial = PolynomialOperations.multiply(divisor_generator_polynomial, AlphaPolynomial(Term(lead_coefficient_alpha, 0)))
-            # convert both polynomials to integer
-            data_codewords_polynomial_int = PolynomialOperations.convert_alpha_to_int(data_codewords_polynomial)
-            divisor_generator_polynomial_int = PolynomialOperations.convert_alpha_to_int(divisor_generator_polynomial)
-            # XOR the result of this operation (Step 3)
-            # the XOR operation is done on a term by term basis, based on the x coefficient for each term.
-            xor_int_polynomials = PolynomialOperations.xor_int(data_codewords_polynomial_int, divisor_generator_polynomial_int)
-            data_codewords_polynomial = PolynomialOperations.convert_int_to_alpha(xor_int_polynomials)
-        return data_codewords_polynomial
+        # the data codeword polynomial is multiplied by x^k (k being the number of error codewords), to avoid the lead term to be too small
+        # during the division process. Shout out to Thonky for the heads up. this is also noted in Section 7.5.2 of the ISO.
+        # with synthetic division this multiplication is implicit: the remainder register is k coefficients wide, so the dividend
+        # is shifted through it by k extra x exponents.
+        # null coefficients of the highest x exponents (e.g., terms that cancelled out) are not part of the divisor, as in __eq__
+        divisor_buffer = divisor._coefficients.rstrip(b'\0')
+        error_codeword_max_exponent = len(divisor_buffer) - 1
+        if error_codeword_max_exponent < 0:
+            raise ValueError("Polynomial division requires a non null divisor")
+        if error_codeword_max_exponent == 0:
+            raise ValueError("Polynomial division requires a divisor of degree 1 or higher (i.e., at least one error codeword)")
+        divisor_coefficients = bytes(divisor_buffer[:error_codeword_max_exponent])
+        divisor_lead_coefficient = divisor_buffer[error_codeword_max_exponent]
+        if divisor_lead_coefficient != 1:
+            # dividing by c * g leaves the same remainder as dividing by the monic g, so a non monic divisor is scaled by the inverse of its
+            # lead coefficient (a^(255 - i) for a lead a^i). Generator polynomials are always monic and skip this step.
+            inverse_lead_coefficient = _GF_256_EXP[255 - _GF_256_LOG[divisor_lead_coefficient]]
+            divisor_coefficients = divisor_coefficients.translate(_GF_256_MUL[inverse_lead_coefficient << 8:(inverse_lead_coefficient + 1) << 8])
+        # with a monic divisor (its lead term is a^0 * x^k), multiplying it by the lead term of the dividend only scales
+        # the coefficients of the remaining terms by the lead coefficient
+        remainder = _reduce_by_generator(dividend._coefficients, divisor_coefficients, error_codeword_max_exponent)
+        # the remainder has exactly k coefficients, x^(k - 1) to x^0, including the null ones (they are error codewords as well)
+        return AlphaPolynomial._from_coefficients(remainder)
 
     @staticmethod
     def xor_int(polynomial_1: IntPolynomial, polynomial_2: IntPolynomial) -> IntPolynomial:
@@ -265,36 +390,21 @@ class PolynomialOperations:
         Returns:
             xor_result (IntPolynomial): an IntPolynomial object as the result of the XOR operation for both polynomials.
         """
-        index = 0
-        terms_polynomial_1 = polynomial_1.get_coefficients()
-        terms_polynomial_2 = polynomial_2.get_coefficients()
-        result = []
-        while index < len(terms_polynomial_1) and index < len(terms_polynomial_2):
-            term_polynomial_1 = terms_polynomial_1[index]
-            term_polynomial_2 = terms_polynomial_2[index]
-            xor_coefficients = term_polynomial_1.get_coefficient() ^ term_polynomial_2.get_coefficient()
-            if xor_coefficients > 0:
-                result.append(Term(xor_coefficients, term_polynomial_1.get_x_exponent()))
-            index += 1
-        # add the remainder of the polynomials:
-        while index < len(terms_polynomial_1):
-            term_polynomial_1 = terms_polynomial_1[index]
-            result.append(Term(term_polynomial_1.get_coefficient(), term_polynomial_1.get_x_exponent()))
-            index += 1
-        while index < len(terms_polynomial_2):
-            term_polynomial_2 = terms_polynomial_2[index]
-            result.append(Term(term_polynomial_2.get_coefficient(), term_polynomial_2.get_x_exponent()))
-            index += 1
-        return IntPolynomial(result)
-
-
+        coefficients_1 = polynomial_1._coefficients
+        coefficients_2 = polynomial_2._coefficients
+        if len(coefficients_1) < len(coefficients_2):
+            coefficients_1, coefficients_2 = coefficients_2, coefficients_1
+        # both polynomials are indexed by x exponent, so reading the buffers as little endian integers aligns the terms with the
+        # same x exponent, and a single big integer XOR handles all of them at once (the remainder of the biggest polynomial is XOR'ed with 0).
+        result = int.from_bytes(coefficients_1, "little") ^ int.from_bytes(coefficients_2, "little")
+        return IntPolynomial._from_coefficients(bytearray(result.to_bytes(len(coefficients_1), "little")))
 
     @staticmethod
     def multiply(polynomial_1: AlphaPolynomial, polynomial_2: AlphaPolynomial) -> AlphaPolynomial:
         """Algorithm to multiply two polinomials.
-           it uses a hash to group the x exponents as the key, and all the coefficients that multiply each of these X's
-           this effectively allows us to calculate the polynomial at the end by adding all the coefficients as soon as they are found
-           with the corresponding X.
+           it is a single convolution pass over the dense coefficients of both polynomials: each non null term of the first polynomial
+           multiplies every term of the second one at once, and the result is added right away, with a XOR, to the coefficients of the
+           x exponents they contribute to.
 
         Args:
             polynomial_1 (Polynomial): First term of multiplication
@@ -305,58 +415,44 @@ class PolynomialOperations:
         """
         if not isinstance(polynomial_1, AlphaPolynomial) or not isinstance(polynomial_2, AlphaPolynomial):
             raise ValueError(f"Polynomials have invalid type. both must have type AlphaPolynomial but they have {type(polynomial_1)} and {type(polynomial_2)}")
-        polynomial_1_coefs = polynomial_1.get_coefficients()
-        polynomial_2_coefs = polynomial_2.get_coefficients()
-        new_polynomial = []
-        x_coefficients = defaultdict(list) # hash map of x coefficients to group alpha coefficients
-        for term_p1 in polynomial_1_coefs:
-            for term_p2 in polynomial_2_coefs:
-                coef_alpha_p1 = term_p1.get_coefficient().get_exponent()
-                x_alpha_p1 =  term_p1.get_x_exponent()
-                coef_alpha_p2 = term_p2.get_coefficient().get_exponent()
-                x_alpha_p2 = term_p2.get_x_exponent()
-                sum_alpha = coef_alpha_p1 + coef_alpha_p2
-                sum_x = x_alpha_p1 + x_alpha_p2
-                x_coefficients[sum_x].append(sum_alpha)
-        # process each alpha coefficient before building the polynomial
-        for key, value in x_coefficients.items():
-            alpha_sum = PolynomialOperations._calculate_alpha_coefficient_sum(value)
-            new_polynomial.append(Term(Alpha(alpha_sum), key))
-        return AlphaPolynomial(new_polynomial)
+        coefficients_1 = polynomial_1._coefficients
+        coefficients_2 = polynomial_2._coefficients
+        if not coefficients_1 or not coefficients_2:
+            return AlphaPolynomial._from_coefficients(bytearray())
+        if len(coefficients_1) == 2:
+            coefficients_1, coefficients_2 = coefficients_2, coefficients_1
+        if len(coefficients_2) == 2:
+            return AlphaPolynomial._from_coefficients(PolynomialOperations._multiply_by_binomial(coefficients_1, coefficients_2[1], coefficients_2[0]))
+        # each non null term of the first polynomial scales the whole second polynomial at once (a row of the multiplication table is
+        # a translation table, see _multiply_by_binomial). The scaled copy is shifted to the x exponent of that term and XOR'd into
+        # the product as a single big integer (see xor_int).
+        multiplication_table = _GF_256_MUL
+        product = 0
+        for x_exponent_1, coefficient_1 in enumerate(coefficients_1):
+            if coefficient_1:
+                scaled_polynomial_2 = coefficients_2.translate(multiplication_table[coefficient_1 << 8:(coefficient_1 + 1) << 8])
+                product ^= int.from_bytes(scaled_polynomial_2, "little") << (x_exponent_1 << 3)
+        return AlphaPolynomial._from_coefficients(bytearray(product.to_bytes(len(coefficients_1) + len(coefficients_2) - 1, "little")))
 
     @staticmethod
-    def _calculate_alpha_coefficient_sum(alpha_coefficients: List[int]) -> Alpha:
-        """Method to calculate the sum of alpha coefficients using XOR and the bit size correction (0 <= i <= 255), for any a^i.
-           the algorithm is as follows:
-           1) iterates over the list of obtained exponents by adding similar terms (as in standard polynomial addition)
-           2) if any of the exponents is greater than 255, normalize it by getting the remanider of exponent by 256 and adding it by the floor of the division of 256 (GF(256))
-           3) xor all the normalized exponents. apply the same normalization rules if xor'ing results in an exponent greater than 255.
-
-        Args:
-            alpha_coefficients (List[int]): List of all coefficients to be added for a single x coefficient
-
-        Returns:
-            Alpha: a new alpha coefficient obtained after adding every alpha coefficient of the sabe x base (x^i).
+    def _multiply_by_binomial(coefficients: bytearray, coefficient_x: int, coefficient_0: int) -> bytearray:
+        """Fast path of multiply for a binomial (coefficient_x * x + coefficient_0), like the factors of the generator polynomials.
+           Row c of the multiplication table holds c * b for every b, so it is a translation table: scaling the whole polynomial by a constant
+           is a single bytes.translate call. The product is then the polynomial scaled by coefficient_x and shifted by one x exponent,
+           XOR'd with the polynomial scaled by coefficient_0, done as a single big integer XOR (see xor_int).
         """
-        calculator = PolynomialOperations.alpha_calculator
-        n = len(alpha_coefficients)
-        normalized_alpha_coefficients = []
-        for exponent in alpha_coefficients:
-            normalized_coefficient = exponent if exponent < 255 else exponent % 256 + math.floor(exponent / 256)
-            normalized_alpha_coefficients.append(normalized_coefficient)
-        if n == 1:
-            return normalized_alpha_coefficients[0]
-        antilog_alpha_coefficients = [ calculator.get_log_from_alpha(exponent) for exponent in normalized_alpha_coefficients ]
-        coefficients_sum = antilog_alpha_coefficients[0]
-        for index in range(1, n):
-            if coefficients_sum >= 256:
-                coefficients_sum = coefficients_sum % 256 + math.floor(coefficients_sum / 256)
-            coefficients_sum = coefficients_sum ^ antilog_alpha_coefficients[index]
-        return calculator.get_antilog_from_alpha(coefficients_sum)
+        multiplication_table = _GF_256_MUL
+        term_x = coefficients if coefficient_x == 1 else coefficients.translate(multiplication_table[coefficient_x << 8:(coefficient_x + 1) << 8])
+        term_0 = coefficients.translate(multiplication_table[coefficient_0 << 8:(coefficient_0 + 1) << 8])
+        product = (int.from_bytes(term_x, "little") << 8) ^ int.from_bytes(term_0, "little")
+        return bytearray(product.to_bytes(len(coefficients) + 1, "little"))
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def generate_generator_polynomial(n: int) -> AlphaPolynomial:
-        """Method to create the polynomial generators for n codewords as per the ISO standards
+        """Method to create the polynomial generators for n codewords as per the ISO standards.
+           The generator polynomials used by the ISO are precomputed (see _ISO_GENERATOR_POLYNOMIALS), any other n is built once and cached:
+           the polynomial is shared by every caller, hence its coefficients are stored as immutable bytes.
 
         Args:
             n (int): number of codewords required
@@ -364,11 +460,23 @@ class PolynomialOperations:
         Returns:
             Polynomial: a Polynomial of degree n to satisfy the conditions
         """
-        polynomial = AlphaPolynomial([Term(Alpha(0), 1), Term(Alpha(0), 0)]) # a0x1 + a0x0
-        for i in range(1, n):
-            next_polynomial = AlphaPolynomial([Term(Alpha(0), 1), Term(Alpha(i), 0)])
-            polynomial = PolynomialOperations.multiply(polynomial, next_polynomial)
-        return polynomial
+        coefficients = _GENERATOR_POLYNOMIALS.get(n)
+        if coefficients is None:
+            coefficients = bytes(PolynomialOperations._build_generator_polynomial(n)._coefficients)
+        return AlphaPolynomial._from_coefficients(coefficients)
+
+    @staticmethod
+    def _build_generator_polynomial(n: int) -> AlphaPolynomial:
+        """Builds the generator polynomial for n codewords as the product (x + a^0)(x + a^1)...(x + a^(n - 1)).
+           It starts from the largest precomputed generator polynomial of degree m < n, if any, so only the factors (x + a^m) to (x + a^(n - 1))
+           are multiplied, each one with the binomial fast path of multiply.
+        """
+        m = max((degree for degree in _GENERATOR_POLYNOMIALS if degree < n), default=1)
+        # the coefficients are integers indexed by x exponent, with no Alpha/Term objects involved
+        coefficients = bytearray(_GENERATOR_POLYNOMIALS[m]) if m in _GENERATOR_POLYNOMIALS else bytearray((1, 1)) # a0x1 + a0x0
+        for i in range(m, n):
+            coefficients = PolynomialOperations._multiply_by_binomial(coefficients, 1, _GF_256_EXP[i]) # a0x1 + aix0
+        return AlphaPolynomial._from_coefficients(coefficients)
     
     @staticmethod
     def convert_int_to_alpha(int_polynomial: IntPolynomial) -> AlphaPolynomial:
@@ -381,11 +489,8 @@ class PolynomialOperations:
         Returns:
             AlphaPolynomial: the same polynonial with alpha coefficients.
         """
-        calculator = PolynomialOperations.alpha_calculator
-        coefficients = [ (term.get_coefficient(), term.get_x_exponent()) for term in int_polynomial.get_coefficients() ]
-        # create a list of terms with the converted alpha value (Int -> Alpha):
-        alpha_terms = [Term(Alpha(calculator.get_antilog_from_alpha(coefficient)), x_exponent) for coefficient, x_exponent in coefficients]
-        return AlphaPolynomial(alpha_terms)
+        # both notations share the same dense storage of GF(256) integer values, only the API representation changes.
+        return AlphaPolynomial._from_coefficients(bytearray(int_polynomial._coefficients))
 
     @staticmethod
     def convert_alpha_to_int(alpha_polynomial: AlphaPolynomial) -> IntPolynomial:
@@ -397,16 +502,13 @@ class PolynomialOperations:
         Returns:
             IntPolynomial: a representation of the coefficients in an integer fashion
         """
-        calculator = PolynomialOperations.alpha_calculator
-        coefficients = [ (term.get_coefficient().get_exponent(), term.get_x_exponent()) for term in alpha_polynomial.get_coefficients() ]
-        int_terms = [ Term(calculator.get_log_from_alpha(coefficient), x_exponent) for coefficient, x_exponent in coefficients]
-        return IntPolynomial(int_terms)
+        return IntPolynomial._from_coefficients(bytearray(alpha_polynomial._coefficients))
 
     @staticmethod
     def get_int_values_from_alpha(alpha_polynomial: AlphaPolynomial) -> List[int]:
-        """ method to retrieve the integer values of alpha coefficients of an AlphaPolynomial object
-           under the hood it casts the AlphaPolynomial object to an IntPolynomial representation
-           and call its method get_coefficient
+        """ method to retrieve the integer values of alpha coefficients of an AlphaPolynomial object,
+           from the highest x exponent down to x^0. Null coefficients are kept, as they are valid error codewords: the list has one value
+           per x exponent up to the degree of the polynomial (e.g., a^0 * x^2 + a^1 * x^0 gives [1, 0, 2], not [1, 2]).
 
         Args:
             alpha_polynomial (AlphaPolynomial): alpha polynomial input (usually an error polynomial)
@@ -414,5 +516,4 @@ class PolynomialOperations:
         Returns:
             coefficient_list (List[int]): list of integer values of the alpha coefficients as the error codewords.
         """
-        int_from_alpha = PolynomialOperations.convert_alpha_to_int(alpha_polynomial)
-        return [ term.get_coefficient() for term in int_from_alpha.get_coefficients() ]
\ No newline at end of file
+        return list(reversed(alpha_polynomial._coefficients))
@@ -0,0 +1,24 @@
+"""Unit test module for class QRCodeBitStream"""
+
+import unittest
+from src.qr.QRCodeBitStream import QRCodeBitStream
+
+
+class TestQRCodeBitStream(unittest.TestCase):
+    """Test class for the packed bit stream used by the encoder"""
+
+    def test_extend_bits_across_bytes(self):
+        """Test that values with arbitrary bit widths are packed most significant bit first"""
+        bit_stream = QRCodeBitStream()
+        bit_stream.extend_ascii(b'0001')
+        bit_stream.extend_bits(8, 8)
+        bit_stream.extend_bits(12, 10)
+        self.assertEqual(len(bit_stream), 22)
+        self.assertEqual(bit_stream.to_ascii(), b'0001000010000000001100')
+        self.assertEqual(bit_stream.to_bytes(), bytes((0b00010000, 0b10000000, 0b00110000)))
+
+    def test_empty_stream(self):
+        """Test the representations of a stream with no bits"""
+        bit_stream = QRCodeBitStream()
+        self.assertEqual(bit_stream.to_ascii(), b'')
+        self.assertEqual(bit_stream.to_bytes(), b'')
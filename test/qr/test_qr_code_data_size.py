@@ -0,0 +1,23 @@
+"""Unit test module for the QRCodeDataSize lookups"""
+
+import unittest
+from src.qr.error.QRCodeDataSize import get_data_size
+from src.qr.error.QRErrorCorrectionLevel import QRErrorCorrectionLevel
+
+
+class TestQRCodeDataSize(unittest.TestCase):
+    """Test class for the data capacity per error correction level and encoding mode"""
+
+    def test_get_data_size(self):
+        """Test the lookup by error correction level and mode name"""
+        self.assertEqual(get_data_size(QRErrorCorrectionLevel.L, "NUMERIC"), 187)
+        self.assertEqual(get_data_size(QRErrorCorrectionLevel.H, "Kanji"), 21)
+        self.assertEqual(get_data_size(QRErrorCorrectionLevel.M, "byte"), 62)
+
+    def test_get_data_size_by_mode_index(self):
+        """Test the lookup by the mode position, and that positions out of the table are rejected"""
+        self.assertEqual(get_data_size(QRErrorCorrectionLevel.M, 2), 62)
+        self.assertEqual(get_data_size(QRErrorCorrectionLevel.Q, 1), 67)
+        for mode_index in (-1, 4, 5):
+            with self.assertRaises(ValueError):
+                get_data_size(QRErrorCorrectionLevel.L, mode_index)
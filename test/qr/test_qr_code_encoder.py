@@ -9,8 +9,10 @@ class TestQRCodeEncoder(unittest.TestCase):
     """Unit test class for QRCodeEncoder methods.
        This class will test all the four implemented modalities to encode data for QR codes.
     """
-    def setUp(self):
-        self._encoder = QRCodeEncoder(4, QRErrorCorrectionLevel.L, QRCodeInputAnalyzer())
+    @classmethod
+    def setUpClass(cls):
+        # the encoder holds no per-input state, so all the tests share one instance
+        cls._encoder = QRCodeEncoder(4, QRErrorCorrectionLevel.L, QRCodeInputAnalyzer())
         
     def test_encode_numeric_is_not_none(self):
         """Test encoding numeric input."""
@@ -26,6 +28,13 @@ class TestQRCodeEncoder(unittest.TestCase):
         """Test encoding alphanumeric input."""
         result = self._encoder.encode_alphanumeric("AC-42", QRCodeEncoder.get_char_count_indicator("ALPHANUMERIC"), QRCodeEncoder.get_mode_indicator("ALPHANUMERIC"))
         self.assertEqual(result, b'0011100111011100111001000010')
+
+    def test_encode_alphanumeric_invalid_character(self):
+        """Test that characters out of Table 5 of ISO 18004 are rejected and lower case letters are accepted"""
+        with self.assertRaises(ValueError):
+            self._encoder.encode_alphanumeric("AC#42", QRCodeEncoder.get_char_count_indicator("ALPHANUMERIC"), QRCodeEncoder.get_mode_indicator("ALPHANUMERIC"))
+        self.assertEqual(self._encoder.encode_alphanumeric("ac-42", QRCodeEncoder.get_char_count_indicator("ALPHANUMERIC"), QRCodeEncoder.get_mode_indicator("ALPHANUMERIC")),
+                         b'0011100111011100111001000010')
         
     def test_encode_byte(self):
         """Test encoding byte input."""
@@ -40,7 +49,12 @@ class TestQRCodeEncoder(unittest.TestCase):
     def test_encode_kanji_multiple_char(self):
         """Test the encoding of more than one Shift-JIS char"""
         result = self._encoder.encode_kanji("こんにちは".encode("shift-jis"), QRCodeEncoder.get_char_count_indicator("KANJI"), QRCodeEncoder.get_mode_indicator("KANJI"))
-        self.assertEqual(result, b'1000100010001010000011010001000001100100000100110001010011111001000001101')
+        self.assertEqual(result, b'1000100000001001100010000101110001000010100100100001001111110000101001101')
+
+    def test_encode_kanji_upper_range(self):
+        """Test the encoding of a Shift-JIS char from the 0xE040 to 0xEBBF range"""
+        result = self._encoder.encode_kanji(bytes((0xe4, 0xaa)), QRCodeEncoder.get_char_count_indicator("KANJI"), QRCodeEncoder.get_mode_indicator("KANJI"))
+        self.assertEqual(result, b'100010001101010101010')
         
     def test_encode_decider(self):
         """ a Single test step to test the encoder itself for each of the modes:"""
@@ -51,6 +65,14 @@ class TestQRCodeEncoder(unittest.TestCase):
         result = self._encoder.encode_data_into_bit_stream("点")
         self.assertEqual(result, b'100010000110110011111')
         
+    def test_encode_decider_uses_overridden_encoders(self):
+        """Test that the encoder dispatch honours the encoding methods overridden by subclasses"""
+        class CustomBytesEncoder(QRCodeEncoder):
+            def encode_bytes(self, input_str, char_count_indicator, mode_indicator):
+                return b'1' + super().encode_bytes(input_str, char_count_indicator, mode_indicator)
+        encoder = CustomBytesEncoder(4, QRErrorCorrectionLevel.L, QRCodeInputAnalyzer())
+        self.assertEqual(encoder.encode_data_into_bit_stream("Hello!"), b'1' + self._encoder.encode_data_into_bit_stream("Hello!"))
+
     def test_encode_string_per_iso_standards(self):
         """ Test the full encoding functionality for codewords instead of single bit streams as in sections 7.4.2 to 7.4.7, and the teriminator / pad codewords
             from Sections 7.4.9 and 7.4.10.
@@ -63,24 +85,25 @@ class TestQRCodeEncoder(unittest.TestCase):
         """ Test to check if the conversion and encoding process works for more than one block """
         qr = self._encoder
         result = qr.generate_blocks(qr.encode_input("HELLO WORLD"))
-        self.assertEqual(result, bytes(('011000010110111100011010001011100101101110001001101010000110100'
-                                      '01110110000010001111011000001000111101100000100011110110000010001'
-                                      '11101100000100011110110000010001111011000001000111101100000100011'
+        self.assertEqual(result, bytes(('01100001011011110001101000101110010110111000100110101000011010001'
                                       '11011000001000111101100000100011110110000010001111011000001000111'
                                       '10110000010001111011000001000111101100000100011110110000010001111'
                                       '01100000100011110110000010001111011000001000111101100000100011110'
                                       '11000001000111101100000100011110110000010001111011000001000111101'
                                       '10000010001111011000001000111101100000100011110110000010001111011'
                                       '00000100011110110000010001111011000001000111101100000100011110110'
-                                      '00001000111101100000100011110110000010001111011000001000110010111'
-                                      '00100101000110111011101110100111001111011011001000110101111111110'
-                                      '01110010101100001011110101010111010001001010110100101000010001100'
-                                      '10001000010001001111000000000'), encoding='utf-8'))
+                                      '00001000111101100000100011110110000010001111011000001000111101100'
+                                      '00010001111011000001000111101100000100011110110000010001111011000'
+                                      '00100011110110000010001111011000001000111101100000100010100110001'
+                                      '00001101011100111111010001000111111101101111000000110010111011111'
+                                      '11011010100101000010100110110111110001000001000011011010101101011'
+                                      '001101000100101110110000000'), encoding='utf-8'))
 
 class TestQRCodeEncoderVer1(unittest.TestCase):
     """ Class for testing QRCodeEncoder for QR code version 1, level M"""
-    def setUp(self):
-        self._encoder = QRCodeEncoder(1, QRErrorCorrectionLevel.M, QRCodeInputAnalyzer())
+    @classmethod
+    def setUpClass(cls):
+        cls._encoder = QRCodeEncoder(1, QRErrorCorrectionLevel.M, QRCodeInputAnalyzer())
 
     def test_encode_data_length_equals_iso_spec(self):
         """ Test to confirm if the encoding with version 1, level M
@@ -98,5 +121,5 @@ class TestQRCodeEncoderVer1(unittest.TestCase):
         result = qr.generate_blocks(qr.encode_input("HELLO WORLD"))
         self.assertEqual(result, bytes(("0110000101101111000110100010111001011011100010011010100001"
                                         "1010001110110000010001111011000001000111101100000100011110"
-                                        "1100000100011100001011110011001011100100100001100100101101"
-                                        "0110101111101100110111111011001100"), encoding='utf-8'))
+                                        "1100000100010000011011010101111101010000100111001110101011"
+                                        "1011001010010000100101101110110100"), encoding='utf-8'))
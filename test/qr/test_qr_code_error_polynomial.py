@@ -14,6 +14,12 @@ class TestQRCodeErrorCodewordPolynomial(TestCase):
         self.assertEqual(str(PolynomialOperations.multiply(p1, p2)),
                          'a^0 * x^2 + a^25 * x^1 + a^1 * x^0' )
 
+    def test_alpha_exponent_normalization(self):
+        """Method to test that alpha exponents wrap around the order of GF(256) multiplicative group (255)"""
+        self.assertEqual(str(Alpha(255)), 'a^0')
+        self.assertEqual(str(Alpha(256)), 'a^1')
+        self.assertEqual(str(Alpha(510)), 'a^0')
+
     def test_only_alpha_poly_can_multiply(self):
         """Method to test that the multiplication only supports AlphaPolynomial as its parameters"""
         p1 = IntPolynomial([Term(0, 1), Term(0, 0)])
@@ -41,7 +47,51 @@ class TestQRCodeErrorCodewordPolynomial(TestCase):
            Annex A of ISO 18004 with eightteen error codewords
         """
         polynomial = PolynomialOperations.generate_generator_polynomial(18)
-        self.assertEqual(str(polynomial), """a^0 * x^18 + a^215 * x^17 + a^234 * x^16 + a^158 * x^15 + a^94 * x^14 + a^184 * x^13 + a^97 * x^12 + a^118 * x^11 + a^170 * x^10 + a^79 * x^9 + a^187 * x^8 + a^152 * x^7 + a^148 * x^6 + a^252 * x^5 + a^179 * x^4 + a^5 * x^3 + a^98 * x^2 + a^96 * x^1 + a^153 * x^0""")
+        exponents = [0, 215, 234, 158, 94, 184, 97, 118, 170, 79, 187, 152, 148, 252, 179, 5, 98, 96, 153]
+        self.assertEqual(polynomial, AlphaPolynomial(*[Term(Alpha(exponent), 18 - index) for index, exponent in enumerate(exponents)]))
+
+    def test_multiplication_table(self):
+        """Method to test the GF(256) multiplication table and its deprecated alias"""
+        self.assertEqual(PolynomialOperations.GF_256_MUL_TABLE[(2 << 8) | 128], 29)
+        self.assertIs(PolynomialOperations.GF_255_XOR_CACHE, PolynomialOperations.GF_256_MUL_TABLE)
+
+    def test_generator_polynomial_is_cached(self):
+        """Method to test that the generator polynomial for the same number of error codewords is built only once"""
+        self.assertIs(PolynomialOperations.generate_generator_polynomial(10),
+                      PolynomialOperations.generate_generator_polynomial(10))
+
+    def test_precomputed_generator_polynomials(self):
+        """Method to test that the precomputed ISO generator polynomials match the ones built at runtime"""
+        for n in (7, 10, 13, 15, 16, 17, 18, 20, 22, 24, 26, 28, 30):
+            self.assertEqual(PolynomialOperations.generate_generator_polynomial(n),
+                             PolynomialOperations._build_generator_polynomial(n))
+
+    def test_polynomial_equality(self):
+        """Method to test that polynomials are compared by notation and terms"""
+        int_polynomial = IntPolynomial([Term(1,2), Term(3, 1), Term(2, 0)])
+        alpha_polynomial = PolynomialOperations.convert_int_to_alpha(int_polynomial)
+        self.assertEqual(alpha_polynomial, AlphaPolynomial([Term(Alpha(0), 2), Term(Alpha(25), 1), Term(Alpha(1), 0)]))
+        self.assertEqual(PolynomialOperations.convert_alpha_to_int(alpha_polynomial), int_polynomial)
+        self.assertNotEqual(alpha_polynomial, int_polynomial)
+        self.assertNotEqual(int_polynomial, IntPolynomial([Term(1,2), Term(2, 0)]))
+
+    def test_int_polynomial_from_values(self):
+        """Method to create an integer polynomial from its values, from the highest x exponent down, and to reject the ones out of GF(256)"""
+        self.assertEqual(IntPolynomial.from_values(2, 0, 1), IntPolynomial([Term(2, 2), Term(1, 0)]))
+        with self.assertRaises(ValueError):
+            IntPolynomial.from_values(2, 256)
+        with self.assertRaises(ValueError):
+            IntPolynomial(2, 1)
+
+    def test_polynomial_reduced_form(self):
+        """Method to test that terms with the same x exponent are added (XOR) and the null ones are dropped, highest x exponent first"""
+        polynomial = IntPolynomial([Term(1, 0), Term(3, 1), Term(3, 1), Term(0, 2), Term(5, 2), Term(6, 2)])
+        self.assertEqual(str(polynomial), "3 * x^2 + 1 * x^0")
+
+    def test_negative_x_exponent(self):
+        """Method to test that terms with a negative x exponent are rejected instead of being added to another term"""
+        with self.assertRaises(ValueError):
+            IntPolynomial([Term(5, 2), Term(7, -1)])
 
     def test_int_polynomial_creation(self):
         """Method to create a basic integer polynomial (i.e., with integer coefficients)"""
@@ -61,6 +111,11 @@ class TestQRCodeErrorCodewordPolynomial(TestCase):
         self.assertEqual(str(PolynomialOperations.convert_alpha_to_int(alpha_polynomial)),
                          '1 * x^10 + 216 * x^9 + 194 * x^8 + 159 * x^7 + 111 * x^6 + 199 * x^5 + 94 * x^4 + 95 * x^3 + 113 * x^2 + 157 * x^1 + 193 * x^0')
 
+    def test_int_values_from_sparse_alpha_polynomial(self):
+        """Method to test that the integer values of an alpha polynomial include its null coefficients"""
+        alpha_polynomial = AlphaPolynomial([Term(Alpha(0), 2), Term(Alpha(1), 0)])
+        self.assertEqual(PolynomialOperations.get_int_values_from_alpha(alpha_polynomial), [1, 0, 2])
+
     def test_unit_test_xor_values(self):
         int_poly_1 = IntPolynomial([Term(32,25) , Term(2,24) , Term(101,23) , Term(10,22) , 
                                     Term(97,21) , Term(197,20) , Term(15,19) , Term(47,18) ,
@@ -69,9 +124,43 @@ class TestQRCodeErrorCodewordPolynomial(TestCase):
                                      Term(209,21) , Term(114,20) , Term(220,19) , Term(77,18) , 
                                      Term(67,17) , Term(64,16) , Term(236,15) , Term(17,14) ,
                                      Term(236,13) , Term(17,12) , Term(236,11) , Term(17,10)])
-        self.assertEqual(str(PolynomialOperations.xor_int(int_poly_1, int_poly_2)),
-                         str(IntPolynomial([Term(89,24) , Term(110,23) , Term(114,22) , Term(176,21) ,
+        self.assertEqual(PolynomialOperations.xor_int(int_poly_1, int_poly_2),
+                         IntPolynomial([Term(89,24) , Term(110,23) , Term(114,22) , Term(176,21) ,
                           Term(183,20) , Term(211,19) , Term(98,18) , Term(197,17) ,
                           Term(10,16) , Term(233,15) , Term(17,14) , Term(236,13) ,
-                          Term(17,12) , Term(236,11) , Term(17,10)])))
+                          Term(17,12) , Term(236,11) , Term(17,10)]))
+
+    def test_divide_by_generator_polynomial(self):
+        """Method to test the error codewords of the data codewords of "HELLO WORLD" in version 1-M, with monic and non monic divisors"""
+        data_codewords = [32, 91, 11, 120, 209, 114, 220, 77, 67, 64, 236, 17, 236, 17, 236, 17]
+        data_polynomial = IntPolynomial.from_values(*data_codewords)
+        generator_polynomial = PolynomialOperations.generate_generator_polynomial(10)
+        error_codewords = [196, 35, 39, 119, 235, 215, 231, 226, 93, 23]
+        self.assertEqual(PolynomialOperations.get_int_values_from_alpha(PolynomialOperations.divide(data_polynomial, generator_polynomial)),
+                         error_codewords)
+        scaled_generator_polynomial = PolynomialOperations.multiply(generator_polynomial, AlphaPolynomial(Term(Alpha(1), 0)))
+        self.assertEqual(PolynomialOperations.get_int_values_from_alpha(PolynomialOperations.divide(data_polynomial, scaled_generator_polynomial)),
+                         error_codewords)
+
+    def test_divide_by_invalid_divisor(self):
+        """Method to test that null and degree 0 divisors are rejected"""
+        data_polynomial = IntPolynomial([Term(32, 2), Term(91, 1), Term(11, 0)])
+        with self.assertRaises(ValueError):
+            PolynomialOperations.divide(data_polynomial, AlphaPolynomial([]))
+        with self.assertRaises(ValueError):
+            PolynomialOperations.divide(data_polynomial, AlphaPolynomial([Term(Alpha(0), 1), Term(Alpha(0), 1)]))
+        with self.assertRaises(ValueError):
+            PolynomialOperations.divide(data_polynomial, AlphaPolynomial([Term(Alpha(3), 0)]))
 
+    def test_divide_ignores_null_highest_terms(self):
+        """Method to test that a divisor whose highest terms are null divides like the equal polynomial without them"""
+        data_polynomial = IntPolynomial([Term(32, 2), Term(91, 1), Term(11, 0)])
+        divisor = AlphaPolynomial([Term(Alpha(0), 1), Term(Alpha(0), 0)])
+        cancelled_divisor = AlphaPolynomial([Term(Alpha(0), 2), Term(Alpha(0), 2), Term(Alpha(0), 1), Term(Alpha(0), 0)])
+        null_lead_divisor = PolynomialOperations.convert_int_to_alpha(IntPolynomial([Term(0, 2), Term(1, 1), Term(1, 0)]))
+        self.assertEqual(cancelled_divisor, divisor)
+        expected_remainder = PolynomialOperations.get_int_values_from_alpha(PolynomialOperations.divide(data_polynomial, divisor))
+        self.assertEqual(expected_remainder, [32 ^ 91 ^ 11])
+        for equal_divisor in (cancelled_divisor, null_lead_divisor):
+            self.assertEqual(PolynomialOperations.get_int_values_from_alpha(PolynomialOperations.divide(data_polynomial, equal_divisor)),
+                             expected_remainder)
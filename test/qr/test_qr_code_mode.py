@@ -0,0 +1,27 @@
+"""Unit test module for the QRCodeMode enum"""
+
+import unittest
+from src.qr.QRCodeMode import QRCodeMode
+from src.qr.QRCodeEncoder import QRCodeEncoder
+
+
+class TestQRCodeMode(unittest.TestCase):
+    """Test class for the encoding modes and their indicators"""
+
+    def test_indicators(self):
+        """Test the mode and character count indicators of each mode"""
+        self.assertEqual(QRCodeMode.NUMERIC.get_mode_indicator(), b'0001')
+        self.assertEqual(QRCodeMode.KANJI.get_mode_indicator(), b'1000')
+        self.assertEqual(QRCodeMode.ALPHANUMERIC.get_char_count_indicator(), 9)
+
+    def test_from_name(self):
+        """Test the lookup by the upper case names and the ones returned by QRCodeInputAnalyzer"""
+        self.assertIs(QRCodeMode.from_name("BYTE"), QRCodeMode.BYTE)
+        self.assertIs(QRCodeMode.from_name("Alphanumeric"), QRCodeMode.ALPHANUMERIC)
+        self.assertIsNone(QRCodeMode.from_name("Unknown"))
+
+    def test_encoder_accepts_modes_and_names(self):
+        """Test that the encoder static lookups accept both a mode and its name"""
+        self.assertEqual(QRCodeEncoder.get_mode_indicator(QRCodeMode.BYTE), QRCodeEncoder.get_mode_indicator("byte"))
+        self.assertEqual(QRCodeEncoder.get_char_count_indicator(QRCodeMode.NUMERIC), 10)
+        self.assertIsNone(QRCodeEncoder.get_mode_indicator("ECI"))
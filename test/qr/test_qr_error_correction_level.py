@@ -0,0 +1,55 @@
+"""Unit test module for the QRErrorCorrectionLevel lookup tables"""
+
+import unittest
+from src.qr.error.QRErrorCorrectionLevel import QRErrorCorrectionLevel
+
+
+class TestQRErrorCorrectionLevel(unittest.TestCase):
+    """Test class for the codeword tables (Table 1, 7 and 9 of ISO 18004) per error correction level"""
+
+    def test_lookup_by_letter(self):
+        """Test that the levels can still be looked up by their letter, besides their table position"""
+        self.assertIs(QRErrorCorrectionLevel("Q"), QRErrorCorrectionLevel.Q)
+        self.assertIs(QRErrorCorrectionLevel("h"), QRErrorCorrectionLevel.H)
+        self.assertIs(QRErrorCorrectionLevel(1), QRErrorCorrectionLevel.M)
+        with self.assertRaises(ValueError):
+            QRErrorCorrectionLevel("X")
+
+    def test_number_of_data_codewords(self):
+        """Test the data codeword lookup for the first and the last version"""
+        self.assertEqual(QRErrorCorrectionLevel.L.get_number_of_data_codewords(4), 80)
+        self.assertEqual(QRErrorCorrectionLevel.H.get_number_of_data_codewords(40), 1276)
+
+    def test_total_number_of_codewords(self):
+        """Test the total codeword lookup, which does not depend on the error correction level"""
+        self.assertEqual(QRErrorCorrectionLevel.M.get_total_number_of_codewords(1), 26)
+        self.assertEqual(QRErrorCorrectionLevel.Q.get_total_number_of_codewords(40), 3706)
+
+    def test_number_of_error_correction_codewords(self):
+        """Test the error correction codewords as the difference of the total and the data codewords"""
+        self.assertEqual(QRErrorCorrectionLevel.M.get_number_of_error_correction_codewords(4), 36)
+
+    def test_numbers_of_bits_per_codewords(self):
+        """Test the number of bits of the data codewords"""
+        self.assertEqual(QRErrorCorrectionLevel.L.get_numbers_of_bits_per_codewords(4), 640)
+
+    def test_error_correction_blocks(self):
+        """Test the block structure lookup and the rejection of versions that are not modelled"""
+        blocks = QRErrorCorrectionLevel.Q.get_number_and_struct_of_error_correction_blocks(5)
+        self.assertEqual([(count, block.data_codewords()) for count, block in blocks], [(2, 15), (2, 16)])
+        for version in (0, 6):
+            with self.assertRaises(ValueError):
+                QRErrorCorrectionLevel.L.get_number_and_struct_of_error_correction_blocks(version)
+
+    def test_level_str_is_letter(self):
+        """Test that the levels keep their letter representation while being usable as table indexes"""
+        self.assertEqual([str(level) for level in QRErrorCorrectionLevel], ["L", "M", "Q", "H"])
+        self.assertEqual(int(QRErrorCorrectionLevel.Q), 2)
+
+    def test_invalid_version(self):
+        """Test that versions out of the range 1 to 40 are rejected instead of wrapping around the tables"""
+        for version in (0, 41):
+            with self.assertRaises(ValueError):
+                QRErrorCorrectionLevel.M.get_number_of_data_codewords(version)
+            with self.assertRaises(ValueError):
+                QRErrorCorrectionLevel.M.get_total_number_of_codewords(version)